@@ -30,6 +30,7 @@ from intentkit.utils.error import (
     intentkit_other_error_handler,
     request_validation_exception_handler,
 )
+from intentkit.wallets.privy import close_http_client as close_privy_http_client
 
 from app.local import (
     agent_router,
@@ -103,6 +104,7 @@ async def lifespan(app: FastAPI):
     logger.info("API server start")
     yield
     # Clean up will run after the API server shutdown
+    await close_privy_http_client()
     cleanup_alert()
     logger.info("Cleaning up and shutdown...")
 
@@ -30,6 +30,7 @@ from intentkit.core.agent import get_agent
 from intentkit.core.autonomous import update_autonomous_task_status
 from intentkit.models.agent import Agent, AgentAutonomousStatus, AgentTable
 from intentkit.utils.alert import cleanup_alert, send_alert
+from intentkit.wallets.privy import close_http_client as close_privy_http_client
 
 from app.entrypoints.autonomous import run_autonomous_task
 
@@ -242,7 +243,9 @@ async def schedule_agent_autonomous_tasks():
                     )
                     if autonomous.cron:
                         logger.info(
-                            f"Scheduling cron task {task_id} with cron: {autonomous.cron}"
+                            "Scheduling cron task %s with cron: %s",
+                            task_id,
+                            autonomous.cron,
                         )
                         _ = scheduler.add_job(
                             run_autonomous_task,
@@ -259,11 +262,15 @@ async def schedule_agent_autonomous_tasks():
                         )
                     else:
                         logger.error(
-                            f"Invalid autonomous configuration for task {task_id}: cron is required (minutes field is deprecated)"
+                            "Invalid autonomous configuration for task %s: cron is required (minutes field is deprecated)",
+                            task_id,
                         )
                 except Exception as e:
                     logger.error(
-                        f"Failed to schedule autonomous task [{agent.id}] {task_id}: {e}"
+                        "Failed to schedule autonomous task [%s] %s: %s",
+                        agent.id,
+                        task_id,
+                        e,
                     )
 
                 # Update the last updated time
@@ -344,6 +351,7 @@ if __name__ == "__main__":
             except Exception as e:
                 logger.error("Error cleaning up heartbeat: %s", e)
 
+            await close_privy_http_client()
             cleanup_alert()
 
         try:
@@ -262,7 +262,7 @@ async def _update_chat_summary_title(agent_id: str, chat_id: str) -> None:
     chat = await Chat.get(chat_id)
     if not chat:
         logger.info(
-            f"Skip chat summary title update because chat was not found: {chat_id}"
+            "Skip chat summary title update because chat was not found: %s", chat_id
         )
         return
     if chat.agent_id != agent_id:
@@ -275,7 +275,9 @@ async def _update_chat_summary_title(agent_id: str, chat_id: str) -> None:
         _ = await chat.update_summary(title)
     except Exception:
         logger.exception(
-            f"Failed to generate chat summary title for chat {chat_id} of agent {agent_id}"
+            "Failed to generate chat summary title for chat %s of agent %s",
+            chat_id,
+            agent_id,
         )
 
 
@@ -295,7 +297,7 @@ async def update_chat_summary_from_first_message(
     chat = await Chat.get(chat_id)
     if not chat:
         logger.info(
-            f"Skip chat summary title update because chat was not found: {chat_id}"
+            "Skip chat summary title update because chat was not found: %s", chat_id
         )
         return
     if chat.agent_id != agent_id:
@@ -308,5 +310,7 @@ async def update_chat_summary_from_first_message(
         _ = await chat.update_summary(title)
     except Exception:
         logger.exception(
-            f"Failed to generate first-message summary title for chat {chat_id} of agent {agent_id}"
+            "Failed to generate first-message summary title for chat %s of agent %s",
+            chat_id,
+            agent_id,
         )
@@ -1,11 +1,14 @@
 import logging
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from intentkit.config.db import get_db
 from intentkit.models.llm import LLMModelInfo, LLMProvider
 
+logger = logging.getLogger(__name__)
+
 # Create a readonly router for metadata endpoints
 metadata_router = APIRouter(tags=["Metadata"])
 
@@ -30,16 +33,17 @@ async def get_llms(db: AsyncSession = Depends(get_db)):
     * `list[LLMModelInfoWithProviderName]` - List of all LLM models with provider display names
     """
     try:
-        result_models = []
-        for model_info in await LLMModelInfo.get_all(db):
-            provider = LLMProvider(model_info.provider)
-            result_models.append(
-                LLMModelInfoWithProviderName(
-                    **model_info.model_dump(),
-                    provider_name=provider.display_name(),
-                )
-            )
-        return result_models
+        # Resolve display names once per request instead of once per model
+        provider_names = {provider: provider.display_name() for provider in LLMProvider}
+        result_models = [
+            {
+                **model_info.model_dump(mode="json"),
+                "provider_name": provider_names[model_info.provider],
+            }
+            for model_info in await LLMModelInfo.get_all(db)
+        ]
+        # Models are already validated; skip re-validation against response_model
+        return JSONResponse(content=result_models)
     except Exception as e:
-        logging.error("Error getting LLM models: %s", e)
+        logger.error("Error getting LLM models: %s", e)
         raise
@@ -1,15 +1,17 @@
+import asyncio
 import importlib
 import json
 import logging
+import os
+import time
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from fastapi import Path as PathParam
-from fastapi.responses import FileResponse, JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import FileResponse, JSONResponse, Response
 
-from intentkit.config.db import get_db
+from intentkit.config.db import get_session
 from intentkit.models.agent import Agent
 from intentkit.utils.error import IntentKitAPIError
 
@@ -21,6 +23,46 @@ schema_router = APIRouter()
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+SKILLS_PATH = PROJECT_ROOT / "intentkit" / "skills"
+ICON_EXTENSIONS = frozenset({"png", "svg", "jpg", "jpeg", "webp"})
+
+
+def _scan_skill_files(
+    base_path: Path,
+) -> tuple[dict[str, Path], dict[tuple[str, str, str], Path]]:
+    """Index skill schema and icon files once at startup.
+
+    Serving lookups from this index replaces the per-request ``resolve()`` and
+    ``is_relative_to`` checks: only files found under ``base_path`` are ever
+    returned, so path traversal is impossible by construction.
+
+    Returns:
+        A tuple of (skill -> schema path, (skill, icon_name, ext) -> icon path)
+    """
+    schemas: dict[str, Path] = {}
+    icons: dict[tuple[str, str, str], Path] = {}
+    if not base_path.is_dir():
+        return schemas, icons
+
+    with os.scandir(base_path) as skill_dirs:
+        for skill_dir in skill_dirs:
+            if not skill_dir.is_dir():
+                continue
+            with os.scandir(skill_dir.path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if entry.name == "schema.json":
+                        schemas[skill_dir.name] = Path(entry.path)
+                        continue
+                    icon_name, _, ext = entry.name.rpartition(".")
+                    if icon_name and ext in ICON_EXTENSIONS:
+                        icons[(skill_dir.name, icon_name, ext)] = Path(entry.path)
+    return schemas, icons
+
+
+_SKILL_SCHEMAS, _SKILL_ICONS = _scan_skill_files(SKILLS_PATH)
+
 
 def _import_skill_category(category: str) -> Any | None:
     """Import a skill category module, returning None on failure."""
@@ -94,6 +136,10 @@ def _filter_unavailable_skills_from_schema(
     return result
 
 
+_SKILL_SCHEMA_KEYS = ("title", "description", "type", "x-icon")
+_SKILL_SCHEMA_PROPERTY_KEYS = ("enabled", "states")
+
+
 def _simplify_skill_schema(skill_schema: dict[str, Any]) -> dict[str, Any]:
     """Simplify skill schema to only keep enabled and states fields.
 
@@ -103,47 +149,25 @@ def _simplify_skill_schema(skill_schema: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Simplified schema with only enabled, states, title, description, and type
     """
-    simplified: dict[str, Any] = {}
-
-    # Keep basic metadata
-    for key in ["title", "description", "type", "x-icon"]:
-        if key in skill_schema:
-            simplified[key] = skill_schema[key]
+    simplified = {
+        key: skill_schema[key] for key in _SKILL_SCHEMA_KEYS if key in skill_schema
+    }
 
     # Keep only enabled and states in properties
-    original_properties = skill_schema.get("properties", {})
-    if original_properties:
-        simplified_properties: dict[str, Any] = {}
-        if "enabled" in original_properties:
-            simplified_properties["enabled"] = original_properties["enabled"]
-        if "states" in original_properties:
-            simplified_properties["states"] = original_properties["states"]
-        if simplified_properties:
-            simplified["properties"] = simplified_properties
+    original_properties = skill_schema.get("properties") or {}
+    simplified_properties = {
+        key: original_properties[key]
+        for key in _SKILL_SCHEMA_PROPERTY_KEYS
+        if key in original_properties
+    }
+    if simplified_properties:
+        simplified["properties"] = simplified_properties
 
     return simplified
 
 
-@schema_router.get("/schema/agent", tags=["Metadata"], operation_id="get_agent_schema")
-async def get_agent_schema(db: AsyncSession = Depends(get_db)) -> JSONResponse:
-    """Get the JSON schema for Agent model with all $ref references resolved.
-
-    This function applies additional adaptations:
-    - Filters out skill categories where available() returns False
-    - Simplifies skill schemas to only keep enabled and states fields
-    - Removes autonomous configuration
-    - Removes telegram-related fields
-
-    Updates the model property in the schema based on LLMModelInfo.get results.
-    For each model in the enum list:
-    - If the model is not found in LLMModelInfo, it remains unchanged
-    - If the model is found but disabled (enabled=False), it is removed from the schema
-    - If the model is found and enabled, its properties are updated based on the LLMModelInfo record
-
-    **Returns:**
-    * `JSONResponse` - The complete JSON schema for the Agent model with application/json content type
-    """
-    schema = await Agent.get_json_schema(db)
+def _adapt_agent_schema(schema: dict[str, Any]) -> None:
+    """Apply the public API adaptations to a freshly loaded agent schema in place."""
     properties = schema.get("properties", {})
 
     # Remove autonomous field
@@ -190,10 +214,67 @@ async def get_agent_schema(db: AsyncSession = Depends(get_db)) -> JSONResponse:
 
         skills_property["properties"] = filtered_skills
 
-    return JSONResponse(
-        content=schema,
-        media_type="application/json",
+
+# Single-flight cache for the adapted agent schema: concurrent requests share
+# one in-flight load, and the hot path serves pre-serialized bytes
+AGENT_SCHEMA_CACHE_TTL = 30  # seconds
+_agent_schema_task: asyncio.Task[bytes] | None = None
+_agent_schema_expires_at: float = 0.0
+
+
+async def _load_agent_schema() -> bytes:
+    async with get_session() as db:
+        schema = await Agent.get_json_schema(db)
+    _adapt_agent_schema(schema)
+    # Same encoding as JSONResponse
+    return json.dumps(
+        schema, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+async def _get_agent_schema() -> bytes:
+    """Get the serialized agent JSON schema, loading it at most once per TTL window."""
+    global _agent_schema_task, _agent_schema_expires_at
+
+    now = time.monotonic()
+    task = _agent_schema_task
+    failed = (
+        task is not None
+        and task.done()
+        and (task.cancelled() or task.exception() is not None)
     )
+    if task is None or failed or now >= _agent_schema_expires_at:
+        task = asyncio.create_task(_load_agent_schema())
+        _agent_schema_task = task
+        _agent_schema_expires_at = now + AGENT_SCHEMA_CACHE_TTL
+
+    # Shield so a cancelled request doesn't cancel the load for other waiters
+    return await asyncio.shield(task)
+
+
+@schema_router.get("/schema/agent", tags=["Metadata"], operation_id="get_agent_schema")
+async def get_agent_schema() -> Response:
+    """Get the JSON schema for Agent model with all $ref references resolved.
+
+    This function applies additional adaptations:
+    - Filters out skill categories where available() returns False
+    - Simplifies skill schemas to only keep enabled and states fields
+    - Removes autonomous configuration
+    - Removes telegram-related fields
+
+    Updates the model property in the schema based on LLMModelInfo.get results.
+    For each model in the enum list:
+    - If the model is not found in LLMModelInfo, it remains unchanged
+    - If the model is found but disabled (enabled=False), it is removed from the schema
+    - If the model is found and enabled, its properties are updated based on the LLMModelInfo record
+
+    The adapted schema is cached, already serialized, for
+    `AGENT_SCHEMA_CACHE_TTL` seconds and concurrent requests share a single load.
+
+    **Returns:**
+    * `Response` - The complete JSON schema for the Agent model with application/json content type
+    """
+    return Response(content=await _get_agent_schema(), media_type="application/json")
 
 
 @schema_router.get(
@@ -203,7 +284,6 @@ async def get_agent_schema(db: AsyncSession = Depends(get_db)) -> JSONResponse:
     responses={
         200: {"description": "Success"},
         404: {"description": "Skill not found"},
-        400: {"description": "Invalid skill name"},
     },
 )
 async def get_skill_schema(
@@ -218,18 +298,16 @@ async def get_skill_schema(
     * `JSONResponse` - The complete JSON schema for the skill with application/json content type
 
     **Raises:**
-    * `IntentKitAPIError` - If the skill is not found or name is invalid
+    * `IntentKitAPIError` - If the skill is not found
     """
-    base_path = PROJECT_ROOT / "intentkit" / "skills"
-    schema_path = base_path / skill / "schema.json"
-    normalized_path = schema_path.resolve()
-
-    if not normalized_path.is_relative_to(base_path):
-        raise IntentKitAPIError(400, "BadRequest", "Invalid skill name")
+    schema_path = _SKILL_SCHEMAS.get(skill)
+    if schema_path is None:
+        raise IntentKitAPIError(404, "NotFound", "Skill schema not found")
 
     try:
-        with open(normalized_path) as f:
-            schema = json.load(f)
+        # Read off the event loop so slow disk IO doesn't stall other requests
+        raw = await asyncio.to_thread(schema_path.read_bytes)
+        schema = json.loads(raw)
     except (FileNotFoundError, json.JSONDecodeError):
         raise IntentKitAPIError(404, "NotFound", "Skill schema not found")
 
@@ -243,7 +321,6 @@ async def get_skill_schema(
     responses={
         200: {"description": "Success"},
         404: {"description": "Skill icon not found"},
-        400: {"description": "Invalid skill name or extension"},
     },
 )
 async def get_skill_icon(
@@ -264,16 +341,10 @@ async def get_skill_icon(
     * `FileResponse` - The icon file with appropriate content type
 
     **Raises:**
-    * `IntentKitAPIError` - If the skill or icon is not found or name is invalid
+    * `IntentKitAPIError` - If the skill or icon is not found
     """
-    base_path = PROJECT_ROOT / "intentkit" / "skills"
-    icon_path = base_path / skill / f"{icon_name}.{ext}"
-    normalized_path = icon_path.resolve()
-
-    if not normalized_path.is_relative_to(base_path):
-        raise IntentKitAPIError(400, "BadRequest", "Invalid skill name")
-
-    if not normalized_path.exists():
+    icon_path = _SKILL_ICONS.get((skill, icon_name, ext))
+    if icon_path is None:
         raise IntentKitAPIError(404, "NotFound", "Skill icon not found")
 
     content_type = (
@@ -285,4 +356,4 @@ async def get_skill_icon(
         if ext in ["webp"]
         else "image/jpeg"
     )
-    return FileResponse(normalized_path, media_type=content_type)
+    return FileResponse(icon_path, media_type=content_type)
@@ -50,7 +50,7 @@ async def run_autonomous_task(
             try:
                 _ = await clear_thread_memory(agent_id, chat_id)
                 logger.debug(
-                    f"Cleared thread memory for task {task_id} (has_memory=False)"
+                    "Cleared thread memory for task %s (has_memory=False)", task_id
                 )
             except Exception as e:
                 # Log the error but continue with execution
@@ -72,11 +72,14 @@ async def run_autonomous_task(
         # Execute agent and get response
         resp = await execute_agent(message)
 
-        # Log the response
-        logger.info(
-            f"Task {task_id} completed: " + "\n".join(str(m) for m in resp),
-            extra={"aid": agent_id},
-        )
+        # Log the response; joining the messages is skipped when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Task %s completed: %s",
+                task_id,
+                "\n".join(str(m) for m in resp),
+                extra={"aid": agent_id},
+            )
 
         # Check response and create error activity if needed
         if not resp:
@@ -90,7 +93,9 @@ async def run_autonomous_task(
                 _ = await create_agent_activity(activity)
             except Exception as e:
                 logger.warning(
-                    f"Failed to create error activity for task {task_id}: {e}",
+                    "Failed to create error activity for task %s: %s",
+                    task_id,
+                    e,
                     extra={"aid": agent_id},
                 )
         else:
@@ -115,13 +120,18 @@ async def run_autonomous_task(
                     _ = await create_agent_activity(activity)
                 except Exception as e:
                     logger.warning(
-                        f"Failed to create error activity for task {task_id}: {e}",
+                        "Failed to create error activity for task %s: %s",
+                        task_id,
+                        e,
                         extra={"aid": agent_id},
                     )
 
     except Exception as e:
         logger.error(
-            f"Error in autonomous task {task_id} for agent {agent_id}: {repr(e)}",
+            "Error in autonomous task %s for agent %s: %r",
+            task_id,
+            agent_id,
+            e,
             exc_info=True,
         )
         try:
@@ -134,6 +144,8 @@ async def run_autonomous_task(
             _ = await create_agent_activity(activity)
         except Exception as activity_error:
             logger.warning(
-                f"Failed to create exception activity for task {task_id}: {activity_error}",
+                "Failed to create exception activity for task %s: %s",
+                task_id,
+                activity_error,
                 extra={"aid": agent_id},
             )
@@ -6,23 +6,26 @@ from pydantic import BaseModel
 from intentkit.clients.twitter import OAuth2UserHandler
 from intentkit.config.config import config
 
+# Scopes requested when an agent authorizes its Twitter account
+TWITTER_OAUTH2_SCOPES: tuple[str, ...] = (
+    "tweet.read",
+    "tweet.write",
+    "users.read",
+    "offline.access",
+    "follows.read",
+    "follows.write",
+    "like.read",
+    "like.write",
+    "media.write",
+)
+
 # Initialize Twitter OAuth2 client
 oauth2_user_handler = OAuth2UserHandler(
     client_id=config.twitter_oauth2_client_id or "",
     client_secret=config.twitter_oauth2_client_secret,
     # backend uri point to twitter_oauth_callback
     redirect_uri=config.twitter_oauth2_redirect_uri or "",
-    scope=[
-        "tweet.read",
-        "tweet.write",
-        "users.read",
-        "offline.access",
-        "follows.read",
-        "follows.write",
-        "like.read",
-        "like.write",
-        "media.write",
-    ],
+    scope=list(TWITTER_OAUTH2_SCOPES),
 )
 
 
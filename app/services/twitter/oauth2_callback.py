@@ -1,11 +1,12 @@
 """Twitter OAuth2 callback handler."""
 
 import asyncio
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, cast
-from urllib.parse import parse_qs, urlencode, urlparse
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse
 
-import tweepy
+import httpx
 from fastapi import APIRouter
 from starlette.responses import JSONResponse, RedirectResponse
 
@@ -18,6 +19,73 @@ from app.services.twitter.oauth2 import oauth2_user_handler
 
 twitter_callback_router = APIRouter(prefix="/callback/auth", tags=["Callback"])
 
+_TWITTER_ME_URL = "https://api.x.com/2/users/me"
+
+# Shared client so callbacks reuse pooled keep-alive connections to the X API
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=30)
+    return _http_client
+
+
+async def get_twitter_me(access_token: str) -> dict[str, Any]:
+    """Fetch the authenticated user's profile with an OAuth2 user access token.
+
+    Args:
+        access_token: OAuth2 user access token
+
+    Returns:
+        The raw API response, with the user under the "data" key
+    """
+    response = await _get_http_client().get(
+        _TWITTER_ME_URL,
+        params={"user.fields": "id,username,name,verified"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    _ = response.raise_for_status()
+    return response.json()
+
+
+@dataclass(frozen=True, slots=True)
+class OAuthState:
+    """Fields carried in the OAuth2 state parameter."""
+
+    agent_id: str = ""
+    redirect_uri: str = ""
+
+    @classmethod
+    def parse(cls, state: str) -> "OAuthState":
+        """Parse a URL-encoded state string in a single pass.
+
+        Unknown keys are ignored and the first value wins for repeated keys.
+        """
+        agent_id = redirect_uri = None
+        for key, value in parse_qsl(state):
+            if key == "agent_id" and agent_id is None:
+                agent_id = value
+            elif key == "redirect_uri" and redirect_uri is None:
+                redirect_uri = value
+        return cls(agent_id=agent_id or "", redirect_uri=redirect_uri or "")
+
+
+# (APP_BASE_URL, "scheme://netloc") of the last parsed base URL
+_base_origin: tuple[str, str] | None = None
+
+
+def _get_base_origin() -> str:
+    """Return the scheme://netloc origin of APP_BASE_URL, parsing it only once."""
+    global _base_origin
+    base_url = config.app_base_url
+    if _base_origin is None or _base_origin[0] != base_url:
+        base = urlparse(base_url)
+        origin = f"{base.scheme}://{base.netloc}" if base.scheme and base.netloc else ""
+        _base_origin = (base_url, origin)
+    return _base_origin[1]
+
 
 def is_valid_redirect_url(url: str) -> bool:
     """Check if a redirect URL is valid and belongs to the configured APP_BASE_URL.
@@ -32,12 +100,21 @@ def is_valid_redirect_url(url: str) -> bool:
         bool: True if URL is valid and under APP_BASE_URL, False otherwise
     """
     try:
+        origin = _get_base_origin()
+        if not origin:
+            return False
+        # Fast path: the origin followed by a delimiter fixes both scheme and
+        # netloc, so the full parse below would give the same answer
+        if url.startswith(origin):
+            rest = url[len(origin) :]
+            if not rest or rest[0] in "/?#":
+                return True
+
         result = urlparse(url)
         if not all([result.scheme, result.netloc]):
             return False
-        base = urlparse(config.app_base_url)
         # Redirect URI must share the same scheme and host as APP_BASE_URL
-        return result.scheme == base.scheme and result.netloc == base.netloc
+        return f"{result.scheme}://{result.netloc}" == origin
     except (ValueError, AttributeError, TypeError):
         return False
 
@@ -72,9 +149,9 @@ async def twitter_oauth_callback(
     redirect_uri = ""
     try:
         # Parse state parameter
-        state_params = parse_qs(state)
-        agent_id = state_params.get("agent_id", [""])[0]
-        redirect_uri = state_params.get("redirect_uri", [""])[0]
+        oauth_state = OAuthState.parse(state)
+        agent_id = oauth_state.agent_id
+        redirect_uri = oauth_state.redirect_uri
 
         if error:
             raise IntentKitAPIError(
@@ -95,7 +172,10 @@ async def twitter_oauth_callback(
                 message="Missing agent_id in state parameter",
             )
 
-        agent = await get_agent(agent_id)
+        # Independent lookups, so run them concurrently
+        agent, agent_data = await asyncio.gather(
+            get_agent(agent_id), AgentData.get(agent_id)
+        )
         if not agent:
             raise IntentKitAPIError(
                 status_code=404,
@@ -103,8 +183,6 @@ async def twitter_oauth_callback(
                 message=f"Agent {agent_id} not found",
             )
 
-        agent_data = await AgentData.get(agent_id)
-
         # Exchange code for tokens (sync HTTP call, run in thread to avoid blocking)
         authorization_response = (
             f"{config.twitter_oauth2_redirect_uri}?state={state}&code={code}"
@@ -120,15 +198,8 @@ async def twitter_oauth_callback(
             token["expires_at"], tz=UTC
         )
 
-        # Get user info (sync HTTP call, run in thread to avoid blocking)
-        client = tweepy.Client(
-            bearer_token=token["access_token"], return_type=cast(Any, dict)
-        )
-        me: dict[str, Any] | Any = await asyncio.to_thread(
-            client.get_me,
-            user_auth=False,
-            user_fields="id,username,name,verified",
-        )
+        # Get user info
+        me = await get_twitter_me(token["access_token"])
 
         username = None
         if me and "data" in me:
@@ -6,27 +6,39 @@ from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from intentkit.config.db import get_session
-from intentkit.models.agent_data import AgentData, AgentDataTable
+from intentkit.config.redis import get_redis
+from intentkit.models.agent_data import AgentDataTable
 
 from app.services.twitter.oauth2 import oauth2_user_handler
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of token refresh calls in flight at once
+REFRESH_CONCURRENCY = 16
+# Refreshed tokens are saved once this many are ready, not after the whole run
+REFRESH_SAVE_BATCH_SIZE = 16
+# Per-agent refresh lock, shared by all scheduler replicas
+REFRESH_LOCK_TTL = 60
 
-async def get_expiring_tokens(minutes_threshold: int = 10) -> Sequence[AgentDataTable]:
+
+async def get_expiring_tokens(
+    minutes_threshold: int = 10, now: datetime | None = None
+) -> Sequence[AgentDataTable]:
     """Get all agents with tokens expiring within the specified threshold.
 
     Args:
         minutes_threshold: Number of minutes before expiration to consider tokens as expiring
+        now: Reference time for both bounds, defaults to the current UTC time
 
     Returns:
         List of AgentData records with expiring tokens
     """
-    expiration_threshold = datetime.now(UTC) + timedelta(minutes=minutes_threshold)
-    broken = datetime.now(UTC) - timedelta(days=1)
+    now = now or datetime.now(UTC)
+    expiration_threshold = now + timedelta(minutes=minutes_threshold)
+    broken = now - timedelta(days=1)
 
     async with get_session() as db:
         result = await db.execute(
@@ -40,16 +52,39 @@ async def get_expiring_tokens(minutes_threshold: int = 10) -> Sequence[AgentData
     return result.scalars().all()
 
 
-async def refresh_token(agent_data_record: AgentDataTable):
+async def refresh_token(agent_data_record: AgentDataTable) -> dict[str, Any] | None:
     """Refresh Twitter OAuth2 token for an agent.
 
     Args:
         agent_data_record: Agent data record containing refresh token
+
+    Returns:
+        The agent data columns to update, or None if the refresh was skipped or failed
     """
+    if not agent_data_record.twitter_refresh_token:
+        return None
+
+    # Twitter revokes the old refresh token on use, so only one replica may
+    # refresh an agent at a time
+    redis = get_redis()
+    lock_key = f"intentkit:twitter:refresh_lock:{agent_data_record.id}"
     try:
-        if not agent_data_record.twitter_refresh_token:
-            return
+        acquired = await redis.set(lock_key, "1", nx=True, ex=REFRESH_LOCK_TTL)
+    except Exception as e:
+        logger.error(
+            "Failed to lock Twitter token refresh for agent %s: %s",
+            agent_data_record.id,
+            e,
+        )
+        return None
+    if not acquired:
+        logger.info(
+            "Twitter token refresh for agent %s is already in progress, skipping",
+            agent_data_record.id,
+        )
+        return None
 
+    try:
         # Get new token using refresh token without blocking the event loop
         token = await asyncio.to_thread(
             oauth2_user_handler.refresh, agent_data_record.twitter_refresh_token
@@ -65,26 +100,97 @@ async def refresh_token(agent_data_record: AgentDataTable):
                 token["expires_at"], UTC
             )
 
-        _ = await AgentData.patch(agent_data_record.id, update_data)
-
         logger.info(
-            f"Successfully refreshed Twitter token for agent {agent_data_record.id}, "
-            f"expires at {agent_data_record.twitter_access_token_expires_at}"
+            "Successfully refreshed Twitter token for agent %s, expires at %s",
+            agent_data_record.id,
+            update_data.get("twitter_access_token_expires_at"),
+        )
+        return update_data
+    except Exception as e:
+        logger.error(
+            "Failed to refresh Twitter token for agent %s: %s", agent_data_record.id, e
         )
+        # Let the next run retry; on success the lock is left to expire so
+        # replicas holding the stale refresh token skip this agent
+        try:
+            await redis.delete(lock_key)
+        except Exception as release_error:
+            logger.warning(
+                "Failed to release Twitter refresh lock for agent %s: %s",
+                agent_data_record.id,
+                release_error,
+            )
+        return None
+
+
+async def save_refreshed_tokens(updates: dict[str, dict[str, Any]]) -> None:
+    """Persist refreshed tokens for many agents in a single bulk UPDATE.
+
+    Twitter has already revoked the old refresh tokens, so if the bulk UPDATE
+    fails each agent is retried on its own and one bad row cannot lose the
+    rest of the batch.
+
+    Args:
+        updates: Mapping of agent id to the agent data columns to update
+    """
+    if not updates:
+        return
+
+    try:
+        async with get_session() as db:
+            _ = await db.execute(
+                update(AgentDataTable),
+                [{"id": agent_id, **data} for agent_id, data in updates.items()],
+            )
+            await db.commit()
+        return
     except Exception as e:
         logger.error(
-            f"Failed to refresh Twitter token for agent {agent_data_record.id}: {str(e)}"
+            "Failed to bulk save refreshed Twitter tokens, saving one by one: %s", e
         )
 
+    for agent_id, data in updates.items():
+        try:
+            async with get_session() as db:
+                _ = await db.execute(
+                    update(AgentDataTable)
+                    .where(AgentDataTable.id == agent_id)
+                    .values(**data)
+                )
+                await db.commit()
+        except Exception as e:
+            logger.error(
+                "Failed to save refreshed Twitter token for agent %s: %s", agent_id, e
+            )
+
 
 async def refresh_expiring_tokens():
     """Refresh all tokens that are about to expire.
 
     This function is designed to be called by the scheduler every minute.
     It will check for tokens expiring in the next 5 minutes and refresh them.
+    Refresh calls run with bounded concurrency, and the new tokens are saved
+    in batches as the refreshes complete.
     """
-    agents = await get_expiring_tokens()
+    now = datetime.now(UTC)
+    agents = await get_expiring_tokens(now=now)
     if not agents:
         return
 
-    _ = await asyncio.gather(*(refresh_token(agent) for agent in agents))
+    semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+    async def _refresh(
+        agent: AgentDataTable,
+    ) -> tuple[str, dict[str, Any] | None]:
+        async with semaphore:
+            return agent.id, await refresh_token(agent)
+
+    pending: dict[str, dict[str, Any]] = {}
+    for completed in asyncio.as_completed([_refresh(agent) for agent in agents]):
+        agent_id, update_data = await completed
+        if update_data:
+            pending[agent_id] = update_data
+        if len(pending) >= REFRESH_SAVE_BATCH_SIZE:
+            await save_refreshed_tokens(pending)
+            pending = {}
+    await save_refreshed_tokens(pending)
@@ -27,6 +27,7 @@ from intentkit.utils.error import (
     intentkit_other_error_handler,
     request_validation_exception_handler,
 )
+from intentkit.wallets.privy import close_http_client as close_privy_http_client
 
 from app.common.health import health_router
 from app.common.metadata import metadata_router
@@ -86,6 +87,7 @@ async def lifespan(app: FastAPI):
 
     logger.info("Team API server start")
     yield
+    await close_privy_http_client()
     cleanup_alert()
     logger.info("Cleaning up and shutdown...")
 
@@ -51,6 +51,53 @@ async def add_column_if_not_exists(
         logger.info("Added column %s to table %s", column.name, table_name)
 
 
+# Indexes added to tables that already hold production data. create_all only
+# builds indexes together with new tables, so existing databases get these here,
+# built CONCURRENTLY outside the migration transaction to avoid blocking writes.
+CONCURRENT_INDEXES: dict[str, str] = {
+    "ix_agent_data_twitter_expiring": (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_agent_data_twitter_expiring "
+        "ON agent_data (twitter_access_token_expires_at) "
+        "WHERE twitter_access_token IS NOT NULL "
+        "AND twitter_refresh_token IS NOT NULL"
+    ),
+}
+
+
+async def create_concurrent_indexes(engine) -> None:
+    """Create the indexes in CONCURRENT_INDEXES if they don't exist.
+
+    A failed concurrent build leaves an INVALID index behind, which IF NOT
+    EXISTS would skip forever, so invalid indexes are dropped and rebuilt.
+    Failures are logged and skipped, a missing index only costs performance.
+
+    Args:
+        engine: SQLAlchemy engine
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, ddl in CONCURRENT_INDEXES.items():
+            try:
+                result = await conn.execute(
+                    text(
+                        "SELECT indisvalid FROM pg_index "
+                        "WHERE indexrelid = to_regclass(:name)"
+                    ),
+                    {"name": name},
+                )
+                if result.scalar() is False:
+                    logger.warning("Rebuilding invalid index %s", name)
+                    await conn.execute(
+                        text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                    )
+                await conn.execute(text(ddl))
+            except Exception as e:
+                logger.error("Error creating index %s: %s", name, e)
+
+
 async def update_table_schema(conn, dialect, model_cls) -> None:
     """Update table schema by adding missing columns from the model.
 
@@ -104,4 +151,6 @@ async def safe_migrate(engine) -> None:
             logger.error("Error updating database schema: %s", e)
             raise
 
+    await create_concurrent_indexes(engine)
+
     logger.info("Database schema updated successfully")
@@ -11,6 +11,15 @@ from intentkit.utils.error import IntentKitAPIError
 logger = logging.getLogger(__name__)
 
 
+async def _patch_wallet_data(agent_id: str, data: dict[str, Any]) -> AgentData:
+    """Patch agent wallet data, dropping any provider cached for the old address."""
+    from intentkit.wallets.cdp import invalidate_wallet_provider
+
+    agent_data = await AgentData.patch(agent_id, data)
+    invalidate_wallet_provider(agent_id)
+    return agent_data
+
+
 async def process_agent_wallet(
     agent: Agent,
     old_wallet_provider: str | None = None,
@@ -100,7 +109,7 @@ async def process_agent_wallet(
                             existing_privy_wallet_id=existing_privy_wallet_id,
                             existing_privy_wallet_address=existing_privy_wallet_address,
                         )
-                        agent_data = await AgentData.patch(
+                        agent_data = await _patch_wallet_data(
                             agent.id,
                             {
                                 "evm_wallet_address": wallet_data[
@@ -122,7 +131,7 @@ async def process_agent_wallet(
         await get_cdp_wallet_provider(agent)
         agent_data = await AgentData.get(agent.id)
     elif current_wallet_provider == "readonly":
-        agent_data = await AgentData.patch(
+        agent_data = await _patch_wallet_data(
             agent.id,
             {
                 "evm_wallet_address": agent.readonly_wallet_address,
@@ -209,7 +218,7 @@ async def process_agent_wallet(
             existing_privy_wallet_id=existing_privy_wallet_id,
             existing_privy_wallet_address=existing_privy_wallet_address,
         )
-        agent_data = await AgentData.patch(
+        agent_data = await _patch_wallet_data(
             agent.id,
             {
                 "evm_wallet_address": wallet_data["smart_wallet_address"],
@@ -254,7 +263,7 @@ async def process_agent_wallet(
             "status": "created",
         }
 
-        agent_data = await AgentData.patch(
+        agent_data = await _patch_wallet_data(
             agent.id,
             {
                 "evm_wallet_address": privy_wallet.address,
@@ -270,7 +279,7 @@ async def process_agent_wallet(
         network_id = agent.network_id or "base-mainnet"
         wallet_data = create_native_wallet(network_id)
 
-        agent_data = await AgentData.patch(
+        agent_data = await _patch_wallet_data(
             agent.id,
             {
                 "evm_wallet_address": wallet_data["address"],
@@ -11,11 +11,14 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     DateTime,
+    Index,
     Numeric,
     String,
     func,
+    text,
     update,
 )
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,6 +33,17 @@ class AgentDataTable(Base):
     """Agent data model for database storage of additional data related to the agent."""
 
     __tablename__: str = "agent_data"
+    __table_args__: Any = (
+        # Serves the periodic scan for Twitter tokens that are about to expire.
+        # Existing databases get it from db_mig.CONCURRENT_INDEXES.
+        Index(
+            "ix_agent_data_twitter_expiring",
+            "twitter_access_token_expires_at",
+            postgresql_where=text(
+                "twitter_access_token IS NOT NULL AND twitter_refresh_token IS NOT NULL"
+            ),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, comment="Same as Agent.id"
@@ -345,17 +359,21 @@ class AgentData(BaseModel):
         Raises:
             HTTPException: If there are database errors
         """
+        # Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING round trip,
+        # instead of load + write + refresh
+        stmt = (
+            insert(AgentDataTable)
+            .values(id=id, **data)
+            .on_conflict_do_update(
+                index_elements=[AgentDataTable.id],
+                set_={**data, "updated_at": datetime.now(UTC)},
+            )
+            .returning(AgentDataTable)
+        )
         async with get_session() as db:
-            agent_data = await db.get(AgentDataTable, id)
-            if not agent_data:
-                agent_data = AgentDataTable(id=id, **data)
-                db.add(agent_data)
-            else:
-                for key, value in data.items():
-                    setattr(agent_data, key, value)
+            agent_data = AgentData.model_validate((await db.scalars(stmt)).one())
             await db.commit()
-            await db.refresh(agent_data)
-            return AgentData.model_validate(agent_data)
+            return agent_data
 
 
 class AgentQuotaTable(Base):
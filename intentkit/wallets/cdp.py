@@ -1,6 +1,10 @@
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, cast
+from typing import Any, TypeGuard, cast
 
 from cdp import CdpClient, EvmServerAccount, TransactionRequestEIP1559
 from eth_typing import HexStr
@@ -14,12 +18,27 @@ from intentkit.models.agent_data import AgentData
 from intentkit.utils.error import IntentKitAPIError
 from intentkit.wallets.web3 import get_async_web3_client
 
-_wallet_providers: dict[str, tuple[str, str, "CdpWalletProvider"]] = {}
+# LRU of wallet providers per agent, bounded in size and age
+WALLET_PROVIDER_CACHE_SIZE = 10_000
+WALLET_PROVIDER_CACHE_TTL = 3600
+
+_wallet_providers: OrderedDict[str, "_ProviderCacheEntry"] = OrderedDict()
+# Server accounts by address; an address always maps to the same account
+_evm_accounts: OrderedDict[str, EvmServerAccount] = OrderedDict()
+_wallet_provider_locks: dict[str, asyncio.Lock] = {}
 _cdp_client: CdpClient | None = None
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ProviderCacheEntry:
+    network_id: str
+    address: str
+    provider: "CdpWalletProvider"
+    expires_at: float
+
+
 class CdpWalletProvider:
     """CDP SDK backed wallet provider for unified on-chain skills."""
 
@@ -169,8 +188,9 @@ async def _ensure_evm_account(
         address = account.address
         logger.info("Created new wallet: %s", address)
 
-    agent_data.evm_wallet_address = address
-    await agent_data.save()
+        agent_data.evm_wallet_address = address
+        await agent_data.save()
+
     if not agent.slug:
         async with get_session() as db:
             db_agent = await db.get(AgentTable, agent.id)
@@ -179,7 +199,13 @@ async def _ensure_evm_account(
                 await db.commit()
 
     if account is None:
-        account = await cdp_client.evm.get_account(address=address)
+        account = _evm_accounts.get(address)
+        if account is None:
+            account = await cdp_client.evm.get_account(address=address)
+    _evm_accounts[address] = account
+    _evm_accounts.move_to_end(address)
+    while len(_evm_accounts) > WALLET_PROVIDER_CACHE_SIZE:
+        _ = _evm_accounts.popitem(last=False)
 
     return account, agent_data
 
@@ -227,24 +253,77 @@ async def get_wallet_provider(agent: Agent) -> CdpWalletProvider:
             "Your agent network ID is not set. Please set it in the agent config.",
         )
 
-    agent_data = await AgentData.get(agent.id)
-    address = agent_data.evm_wallet_address
+    # Entries are dropped by invalidate_wallet_provider when the address changes,
+    # so a hit needs no database read
+    cache_entry = _get_cached_provider(agent.id)
+    if cache_entry and cache_entry.network_id == agent.network_id:
+        return cache_entry.provider
+
+    # Serialize per agent so concurrent first calls don't both create an account
+    lock = _wallet_provider_locks.setdefault(agent.id, asyncio.Lock())
+    async with lock:
+        agent_data = await AgentData.get(agent.id)
+        return await _load_wallet_provider(agent, agent.network_id, agent_data)
+
+
+def invalidate_wallet_provider(agent_id: str) -> None:
+    """Drop the cached wallet provider of an agent whose wallet address changed."""
+    _ = _wallet_providers.pop(agent_id, None)
+
+
+def _get_cached_provider(agent_id: str) -> _ProviderCacheEntry | None:
+    entry = _wallet_providers.get(agent_id)
+    if entry is None:
+        return None
+    if entry.expires_at <= time.monotonic():
+        del _wallet_providers[agent_id]
+        return None
+    _wallet_providers.move_to_end(agent_id)
+    return entry
+
+
+def _cache_entry_matches(
+    entry: _ProviderCacheEntry | None, network_id: str, address: str | None
+) -> TypeGuard[_ProviderCacheEntry]:
+    # A changed wallet address invalidates the entry; no address yet means the
+    # account is still being created, so any cached one is current
+    return (
+        entry is not None
+        and entry.network_id == network_id
+        and (not address or entry.address == address)
+    )
 
-    cache_entry = _wallet_providers.get(agent.id)
-    if cache_entry:
-        cached_network_id, cached_address, provider = cache_entry
-        if cached_network_id == agent.network_id:
-            if not address:
-                address = cached_address or provider.get_address()
-            if cached_address == address:
-                return provider
 
-    account, agent_data = await _ensure_evm_account(agent, agent_data)
+def _cache_provider(
+    agent_id: str, network_id: str, address: str, provider: CdpWalletProvider
+) -> None:
+    _wallet_providers[agent_id] = _ProviderCacheEntry(
+        network_id=network_id,
+        address=address,
+        provider=provider,
+        expires_at=time.monotonic() + WALLET_PROVIDER_CACHE_TTL,
+    )
+    _wallet_providers.move_to_end(agent_id)
+    while len(_wallet_providers) > WALLET_PROVIDER_CACHE_SIZE:
+        evicted_id, _ = _wallet_providers.popitem(last=False)
+        lock = _wallet_provider_locks.get(evicted_id)
+        if lock is not None and not lock.locked():
+            del _wallet_provider_locks[evicted_id]
+
+
+async def _load_wallet_provider(
+    agent: Agent, network_id: str, agent_data: AgentData
+) -> CdpWalletProvider:
+    # Another caller may have built the provider while we waited for the lock
+    cache_entry = _get_cached_provider(agent.id)
+    if _cache_entry_matches(cache_entry, network_id, agent_data.evm_wallet_address):
+        return cache_entry.provider
+
+    account, _ = await _ensure_evm_account(agent, agent_data)
     address = account.address
 
     cdp_client = get_cdp_client()
     cdp_network = get_cdp_network(agent)
-    network_id = agent.network_id
 
     wallet_provider = CdpWalletProvider(
         cdp_client=cdp_client,
@@ -252,7 +331,7 @@ async def get_wallet_provider(agent: Agent) -> CdpWalletProvider:
         network=cdp_network,
         web3_client=get_async_web3_client(network_id),
     )
-    _wallet_providers[agent.id] = (network_id, address, wallet_provider)
+    _cache_provider(agent.id, network_id, address, wallet_provider)
     return wallet_provider
 
 
@@ -271,4 +350,5 @@ __all__ = [
     "get_cdp_network",
     "get_evm_account",
     "get_wallet_provider",
+    "invalidate_wallet_provider",
 ]
@@ -1,4 +1,4 @@
-from intentkit.wallets.privy_client import PrivyClient
+from intentkit.wallets.privy_client import PrivyClient, close_http_client
 from intentkit.wallets.privy_nonce import MasterWalletNonceManager, get_nonce_manager
 from intentkit.wallets.privy_safe import (
     SafeClient,
@@ -23,6 +23,7 @@ from intentkit.wallets.privy_safe import (
 from intentkit.wallets.privy_signer import PrivyWalletSigner, get_wallet_signer
 from intentkit.wallets.privy_types import (
     CHAIN_CONFIGS,
+    CHAIN_CONFIGS_BY_ID,
     MULTI_SEND_ADDRESS,
     MULTI_SEND_CALL_ONLY_ADDRESS,
     SAFE_ABI,
@@ -45,6 +46,7 @@ from intentkit.wallets.privy_utils import (
 
 __all__ = [
     "CHAIN_CONFIGS",
+    "CHAIN_CONFIGS_BY_ID",
     "MULTI_SEND_ADDRESS",
     "MULTI_SEND_CALL_ONLY_ADDRESS",
     "SAFE_ABI",
@@ -63,6 +65,7 @@ __all__ = [
     "TransactionResult",
     "WalletProvider",
     "canonicalize_json",
+    "close_http_client",
     "convert_typed_data_to_privy_format",
     "deploy_safe",
     "enable_allowance_module",
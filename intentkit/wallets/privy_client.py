@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import logging
@@ -19,6 +20,38 @@ from intentkit.wallets.privy_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Shared by all Privy and Safe API calls so connections are reused. A client is
+# bound to the event loop it runs on, so there is one per loop: the app's own and
+# the long-lived loop PrivyWalletSigner runs on. Clients of loops that have since
+# closed are dropped.
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        for stale_loop in [other for other in _http_clients if other.is_closed()]:
+            del _http_clients[stale_loop]
+        client = httpx.AsyncClient(timeout=30.0)
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP clients, each on the event loop that owns it."""
+    current_loop = asyncio.get_running_loop()
+    clients = list(_http_clients.items())
+    _http_clients.clear()
+    for loop, client in clients:
+        if loop is current_loop:
+            await client.aclose()
+        elif loop.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            )
+
 
 # =============================================================================
 # Privy Client
@@ -150,24 +183,24 @@ class PrivyClient:
         if display_name:
             payload["display_name"] = display_name
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            url,
+            json=payload,
+            auth=(self.app_id, self.app_secret),
+            headers=self._get_headers(),
+            timeout=30.0,
+        )
 
-            if response.status_code not in (200, 201):
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    "Failed to create Privy key quorum",
-                )
+        if response.status_code not in (200, 201):
+            raise IntentKitAPIError(
+                response.status_code,
+                "PrivyAPIError",
+                "Failed to create Privy key quorum",
+            )
 
-            data = response.json()
-            return data["id"]
+        data = response.json()
+        return data["id"]
 
     async def create_wallet(
         self,
@@ -233,36 +266,36 @@ class PrivyClient:
             signature_count,
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=headers,
-                timeout=30.0,
-            )
-
-            if response.status_code not in (200, 201):
-                logger.info(
-                    "Privy create_wallet response: status=%s auth_sig_count=%s body=%s",
-                    response.status_code,
-                    signature_count,
-                    response.text,
-                )
+        client = get_http_client()
+        response = await client.post(
+            url,
+            json=payload,
+            auth=(self.app_id, self.app_secret),
+            headers=headers,
+            timeout=30.0,
+        )
 
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    "Failed to create Privy wallet",
-                )
+        if response.status_code not in (200, 201):
+            logger.info(
+                "Privy create_wallet response: status=%s auth_sig_count=%s body=%s",
+                response.status_code,
+                signature_count,
+                response.text,
+            )
 
-            data = response.json()
-            return PrivyWallet(
-                id=data["id"],
-                address=data["address"],
-                chain_type=data["chain_type"],
+            raise IntentKitAPIError(
+                response.status_code,
+                "PrivyAPIError",
+                "Failed to create Privy wallet",
             )
 
+        data = response.json()
+        return PrivyWallet(
+            id=data["id"],
+            address=data["address"],
+            chain_type=data["chain_type"],
+        )
+
     async def get_wallet(self, wallet_id: str) -> PrivyWallet:
         """Get a specific wallet by ID."""
         if not self.app_id or not self.app_secret:
@@ -271,33 +304,41 @@ class PrivyClient:
             )
 
         url = f"{self.base_url}/wallets/{wallet_id}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                auth=(self.app_id, self.app_secret),
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-
-            if response.status_code != 200:
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    f"Failed to get Privy wallet {wallet_id}",
-                )
+        client = get_http_client()
+        response = await client.get(
+            url,
+            auth=(self.app_id, self.app_secret),
+            headers=self._get_headers(),
+            timeout=30.0,
+        )
 
-            data = response.json()
-            return PrivyWallet(
-                id=data["id"],
-                address=data["address"],
-                chain_type=data["chain_type"],
+        if response.status_code != 200:
+            raise IntentKitAPIError(
+                response.status_code,
+                "PrivyAPIError",
+                f"Failed to get Privy wallet {wallet_id}",
             )
 
-    async def sign_message(self, wallet_id: str, message: str) -> str:
-        """Sign a message using the Privy server wallet.
+        data = response.json()
+        return PrivyWallet(
+            id=data["id"],
+            address=data["address"],
+            chain_type=data["chain_type"],
+        )
 
-        Uses personal_sign which signs the message with Ethereum's
-        personal_sign prefix: "\\x19Ethereum Signed Message:\\n" + len(message) + message
+    async def _rpc(
+        self,
+        wallet_id: str,
+        payload: dict[str, Any],
+        *,
+        error_message: str,
+        include_body: bool = False,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """Call the wallet RPC endpoint and return the response `data` object.
+
+        On failure `error_message` is raised as is, followed by the response
+        body when `include_body` is set.
         """
         if not self.app_id or not self.app_secret:
             raise IntentKitAPIError(
@@ -305,13 +346,6 @@ class PrivyClient:
             )
 
         url = f"{self.base_url}/wallets/{wallet_id}/rpc"
-        payload = {
-            "method": "personal_sign",
-            "params": {
-                "message": message,
-                "encoding": "utf-8",
-            },
-        }
         headers = self._get_headers()
         authorization_signature = self._get_authorization_signature(
             url=url,
@@ -340,33 +374,52 @@ class PrivyClient:
                 ",".join(self._authorization_key_fingerprints),
             )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=headers,
-                timeout=30.0,
+        client = get_http_client()
+        response = await client.post(
+            url,
+            json=payload,
+            auth=(self.app_id, self.app_secret),
+            headers=headers,
+            timeout=timeout,
+        )
+
+        if response.status_code not in (200, 201):
+            logger.info(
+                "Privy rpc response: wallet_id=%s method=%s status=%s auth_sig_count=%s body=%s",
+                wallet_id,
+                payload.get("method"),
+                response.status_code,
+                signature_count,
+                response.text,
             )
 
-            if response.status_code not in (200, 201):
-                logger.info(
-                    "Privy rpc response: wallet_id=%s method=%s status=%s auth_sig_count=%s body=%s",
-                    wallet_id,
-                    payload.get("method"),
-                    response.status_code,
-                    signature_count,
-                    response.text,
-                )
+            if include_body:
+                error_message = f"{error_message}: {response.text}"
+            raise IntentKitAPIError(
+                response.status_code, "PrivyAPIError", error_message
+            )
 
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    "Failed to sign message with Privy wallet",
-                )
+        return response.json()["data"]
 
-            data = response.json()
-            return data["data"]["signature"]
+    async def sign_message(self, wallet_id: str, message: str) -> str:
+        """Sign a message using the Privy server wallet.
+
+        Uses personal_sign which signs the message with Ethereum's
+        personal_sign prefix: "\\x19Ethereum Signed Message:\\n" + len(message) + message
+        """
+        payload = {
+            "method": "personal_sign",
+            "params": {
+                "message": message,
+                "encoding": "utf-8",
+            },
+        }
+        data = await self._rpc(
+            wallet_id,
+            payload,
+            error_message="Failed to sign message with Privy wallet",
+        )
+        return data["signature"]
 
     async def sign_hash(self, wallet_id: str, hash_bytes: bytes) -> str:
         """Sign a raw hash directly using the Privy server wallet.
@@ -374,85 +427,24 @@ class PrivyClient:
         Uses secp256k1_sign which signs the raw hash without any prefix.
         This is different from personal_sign which adds Ethereum's message prefix.
         """
-        if not self.app_id or not self.app_secret:
-            raise IntentKitAPIError(
-                500, "PrivyConfigError", "Privy credentials missing"
-            )
-
         # Privy expects the hash as a hex string with 0x prefix
-        hash_hex = "0x" + hash_bytes.hex()
+        hash_hex = f"0x{hash_bytes.hex()}"
 
-        url = f"{self.base_url}/wallets/{wallet_id}/rpc"
         payload = {
             "method": "secp256k1_sign",
             "params": {
                 "hash": hash_hex,
             },
         }
-        headers = self._get_headers()
-        authorization_signature = self._get_authorization_signature(
-            url=url,
-            body=payload,
-            signed_headers={"privy-app-id": self.app_id or ""},
-        )
-        signature_count = (
-            len([s for s in authorization_signature.split(",") if s.strip()])
-            if authorization_signature
-            else 0
-        )
-        if authorization_signature:
-            headers["privy-authorization-signature"] = authorization_signature
-
-        logger.info(
-            "Privy rpc request: wallet_id=%s method=%s base_url=%s auth_keys_configured=%s auth_sig_count=%s",
+        data = await self._rpc(
             wallet_id,
-            payload.get("method"),
-            self.base_url,
-            len(self.authorization_private_keys),
-            signature_count,
+            payload,
+            error_message="Failed to sign hash with Privy wallet",
         )
-        if self._authorization_key_fingerprints:
-            logger.info(
-                "Privy rpc auth fingerprints: %s",
-                ",".join(self._authorization_key_fingerprints),
-            )
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=headers,
-                timeout=30.0,
-            )
-
-            if response.status_code not in (200, 201):
-                logger.info(
-                    "Privy rpc response: wallet_id=%s method=%s status=%s auth_sig_count=%s body=%s",
-                    wallet_id,
-                    payload.get("method"),
-                    response.status_code,
-                    signature_count,
-                    response.text,
-                )
-
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    "Failed to sign hash with Privy wallet",
-                )
-
-            data = response.json()
-            return data["data"]["signature"]
+        return data["signature"]
 
     async def sign_typed_data(self, wallet_id: str, typed_data: dict[str, Any]) -> str:
         """Sign typed data (EIP-712) using the Privy server wallet."""
-        if not self.app_id or not self.app_secret:
-            raise IntentKitAPIError(
-                500, "PrivyConfigError", "Privy credentials missing"
-            )
-
-        url = f"{self.base_url}/wallets/{wallet_id}/rpc"
         # Convert typed_data to Privy format (primaryType -> primary_type)
         # then sanitize to convert bytes to hex strings for JSON serialization
         privy_typed_data = convert_typed_data_to_privy_format(typed_data)
@@ -463,56 +455,12 @@ class PrivyClient:
                 "typed_data": sanitized_typed_data,
             },
         }
-        headers = self._get_headers()
-        authorization_signature = self._get_authorization_signature(
-            url=url,
-            body=payload,
-            signed_headers={"privy-app-id": self.app_id or ""},
-        )
-        signature_count = (
-            len([s for s in authorization_signature.split(",") if s.strip()])
-            if authorization_signature
-            else 0
-        )
-        if authorization_signature:
-            headers["privy-authorization-signature"] = authorization_signature
-
-        logger.info(
-            "Privy rpc request: wallet_id=%s method=%s base_url=%s auth_keys_configured=%s auth_sig_count=%s",
+        data = await self._rpc(
             wallet_id,
-            payload.get("method"),
-            self.base_url,
-            len(self.authorization_private_keys),
-            signature_count,
+            payload,
+            error_message="Failed to sign typed data with Privy wallet",
         )
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=headers,
-                timeout=30.0,
-            )
-
-            if response.status_code not in (200, 201):
-                logger.info(
-                    "Privy rpc response: wallet_id=%s method=%s status=%s auth_sig_count=%s body=%s",
-                    wallet_id,
-                    payload.get("method"),
-                    response.status_code,
-                    signature_count,
-                    response.text,
-                )
-
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    "Failed to sign typed data with Privy wallet",
-                )
-
-            data = response.json()
-            return data["data"]["signature"]
+        return data["signature"]
 
     async def send_transaction(
         self,
@@ -523,12 +471,6 @@ class PrivyClient:
         data: str = "0x",
     ) -> str:
         """Send a transaction using the Privy server wallet."""
-        if not self.app_id or not self.app_secret:
-            raise IntentKitAPIError(
-                500, "PrivyConfigError", "Privy credentials missing"
-            )
-
-        url = f"{self.base_url}/wallets/{wallet_id}/rpc"
         payload = {
             "method": "eth_sendTransaction",
             "caip2": f"eip155:{chain_id}",
@@ -540,59 +482,11 @@ class PrivyClient:
                 }
             },
         }
-
-        headers = self._get_headers()
-        authorization_signature = self._get_authorization_signature(
-            url=url,
-            body=payload,
-            signed_headers={"privy-app-id": self.app_id or ""},
-        )
-        signature_count = (
-            len([s for s in authorization_signature.split(",") if s.strip()])
-            if authorization_signature
-            else 0
-        )
-        if authorization_signature:
-            headers["privy-authorization-signature"] = authorization_signature
-
-        logger.info(
-            "Privy rpc request: wallet_id=%s method=%s base_url=%s auth_keys_configured=%s auth_sig_count=%s",
+        data_response = await self._rpc(
             wallet_id,
-            payload.get("method"),
-            self.base_url,
-            len(self.authorization_private_keys),
-            signature_count,
+            payload,
+            error_message="Failed to send transaction",
+            include_body=True,
+            timeout=60.0,
         )
-        if self._authorization_key_fingerprints:
-            logger.info(
-                "Privy rpc auth fingerprints: %s",
-                ",".join(self._authorization_key_fingerprints),
-            )
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                auth=(self.app_id, self.app_secret),
-                headers=headers,
-                timeout=60.0,
-            )
-
-            if response.status_code not in (200, 201):
-                logger.info(
-                    "Privy rpc response: wallet_id=%s method=%s status=%s auth_sig_count=%s body=%s",
-                    wallet_id,
-                    payload.get("method"),
-                    response.status_code,
-                    signature_count,
-                    response.text,
-                )
-
-                raise IntentKitAPIError(
-                    response.status_code,
-                    "PrivyAPIError",
-                    f"Failed to send transaction: {response.text}",
-                )
-
-            data_response = response.json()
-            return data_response["data"]["hash"]
+        return data_response["hash"]
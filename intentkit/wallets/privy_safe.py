@@ -1,8 +1,8 @@
+import asyncio
 import logging
 from decimal import Decimal, InvalidOperation
 from typing import Any, Literal, cast, overload
 
-import httpx
 from eth_abi.abi import encode
 from eth_account import Account
 from eth_utils.address import to_checksum_address
@@ -11,10 +11,11 @@ from web3.types import TxParams, TxReceipt
 
 from intentkit.config.config import config
 from intentkit.utils.error import IntentKitAPIError
-from intentkit.wallets.privy_client import PrivyClient
+from intentkit.wallets.privy_client import PrivyClient, get_http_client
 from intentkit.wallets.privy_nonce import get_nonce_manager
 from intentkit.wallets.privy_types import (
     CHAIN_CONFIGS,
+    CHAIN_CONFIGS_BY_ID,
     MULTI_SEND_CALL_ONLY_ADDRESS,
     SAFE_FALLBACK_HANDLER_ADDRESS,
     SAFE_PROXY_FACTORY_ADDRESS,
@@ -27,6 +28,73 @@ from intentkit.wallets.web3 import get_async_web3_client
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# Function Selectors and Type Hashes
+# =============================================================================
+
+# Signatures are fixed, so hash them once at import instead of per call
+SETUP_SELECTOR = keccak(
+    text="setup(address[],uint256,address,bytes,address,address,uint256,address)"
+)[:4]
+EXEC_TRANSACTION_SELECTOR = keccak(
+    text="execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)"
+)[:4]
+NONCE_SELECTOR = keccak(text="nonce()")[:4]
+TRANSFER_SELECTOR = keccak(text="transfer(address,uint256)")[:4]
+BALANCE_OF_SELECTOR = keccak(text="balanceOf(address)")[:4]
+GET_TOKEN_ALLOWANCE_SELECTOR = keccak(
+    text="getTokenAllowance(address,address,address)"
+)[:4]
+GENERATE_TRANSFER_HASH_SELECTOR = keccak(
+    text="generateTransferHash(address,address,address,uint96,address,uint96,uint16)"
+)[:4]
+EXECUTE_ALLOWANCE_TRANSFER_SELECTOR = keccak(
+    text="executeAllowanceTransfer(address,address,address,uint96,address,uint96,address,bytes)"
+)[:4]
+CREATE_PROXY_WITH_NONCE_SELECTOR = keccak(
+    text="createProxyWithNonce(address,bytes,uint256)"
+)[:4]
+IS_MODULE_ENABLED_SELECTOR = keccak(text="isModuleEnabled(address)")[:4]
+ENABLE_MODULE_SELECTOR = keccak(text="enableModule(address)")[:4]
+ADD_DELEGATE_SELECTOR = keccak(text="addDelegate(address)")[:4]
+SET_ALLOWANCE_SELECTOR = keccak(
+    text="setAllowance(address,address,uint96,uint16,uint32)"
+)[:4]
+MULTI_SEND_SELECTOR = keccak(text="multiSend(bytes)")[:4]
+DOMAIN_SEPARATOR_TYPEHASH = keccak(
+    text="EIP712Domain(uint256 chainId,address verifyingContract)"
+)
+SAFE_TX_TYPEHASH = keccak(
+    text="SafeTx(address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,uint256 baseGas,uint256 gasPrice,address gasToken,address refundReceiver,uint256 nonce)"
+)
+PROXY_CREATION_TOPIC = keccak(text="ProxyCreation(address,address)").hex()
+
+# CREATE2 preimage prefix: 0xff ++ SafeProxyFactory address
+CREATE2_PREFIX = b"\xff" + bytes.fromhex(SAFE_PROXY_FACTORY_ADDRESS[2:])
+
+# Proxy creation code (Safe v1.3.0 GnosisSafeProxyFactory)
+# This is the bytecode that deploys a minimal proxy pointing to the singleton
+SAFE_PROXY_CREATION_CODE = bytes.fromhex(
+    "608060405234801561001057600080fd5b506040516101e63803806101e68339818101604052602081101561003357600080fd5b8101908080519060200190929190505050600073ffffffffffffffffffffffffffffffffffffffff168173ffffffffffffffffffffffffffffffffffffffff1614156100ca576040517f08c379a00000000000000000000000000000000000000000000000000000000081526004018080602001828103825260228152602001806101c46022913960400191505060405180910390fd5b806000806101000a81548173ffffffffffffffffffffffffffffffffffffffff021916908373ffffffffffffffffffffffffffffffffffffffff1602179055505060ab806101196000396000f3fe608060405273ffffffffffffffffffffffffffffffffffffffff600054167fa619486e0000000000000000000000000000000000000000000000000000000060003514156050578060005260206000f35b3660008037600080366000845af43d6000803e60008114156070573d6000fd5b3d6000f3fea2646970667358221220d1429297349653a4918076d650332de1a1068c5f3e07c5c82360c277770b955264736f6c63430007060033496e76616c69642073696e676c65746f6e20616464726573732070726f7669646564"
+)
+
+# keccak256(creationCode ++ abi.encode(singleton)) per singleton address
+_proxy_init_code_hashes: dict[str, bytes] = {}
+
+
+def _get_proxy_init_code_hash(singleton_address: str) -> bytes:
+    init_code_hash = _proxy_init_code_hashes.get(singleton_address)
+    if init_code_hash is None:
+        init_code = SAFE_PROXY_CREATION_CODE + encode(["address"], [singleton_address])
+        init_code_hash = keccak(init_code)
+        _proxy_init_code_hashes[singleton_address] = init_code_hash
+    return init_code_hash
+
+
+# Predicted Safe addresses keyed by (singleton, owner, salt nonce, threshold)
+PREDICTED_SAFE_ADDRESS_CACHE_SIZE = 4096
+_predicted_safe_addresses: dict[tuple[str, str, int, int], str] = {}
+
 
 # =============================================================================
 # Safe Smart Account Client
@@ -76,8 +144,21 @@ class SafeClient:
         This calculates the CREATE2 address that would be deployed
         for a Safe with the given parameters.
         """
+        if self.chain_config is None:
+            raise ValueError("Chain config not initialized")
         owner_address = to_checksum_address(owner_address)
 
+        # The result is deterministic, so reuse earlier predictions
+        cache_key = (
+            self.chain_config.safe_singleton_address,
+            owner_address,
+            salt_nonce,
+            threshold,
+        )
+        predicted = _predicted_safe_addresses.get(cache_key)
+        if predicted is not None:
+            return predicted
+
         # Build the initializer (setup call data)
         initializer = self.build_safe_initializer(
             owners=[owner_address],
@@ -85,7 +166,12 @@ class SafeClient:
         )
 
         # Calculate CREATE2 address
-        return self._calculate_create2_address(initializer, salt_nonce)
+        predicted = self._calculate_create2_address(initializer, salt_nonce)
+        if len(_predicted_safe_addresses) >= PREDICTED_SAFE_ADDRESS_CACHE_SIZE:
+            # Drop the oldest prediction
+            del _predicted_safe_addresses[next(iter(_predicted_safe_addresses))]
+        _predicted_safe_addresses[cache_key] = predicted
+        return predicted
 
     def build_safe_initializer(
         self,
@@ -119,12 +205,7 @@ class SafeClient:
             ],
         )
 
-        # Function selector for setup()
-        setup_selector = keccak(
-            text="setup(address[],uint256,address,bytes,address,address,uint256,address)"
-        )[:4]
-
-        return setup_selector + setup_data
+        return SETUP_SELECTOR + setup_data
 
     def _calculate_create2_address(self, initializer: bytes, salt_nonce: int) -> str:
         """Calculate the CREATE2 address for a Safe deployment.
@@ -141,25 +222,17 @@ class SafeClient:
         initializer_hash = keccak(initializer)
         salt = keccak(initializer_hash + encode(["uint256"], [salt_nonce]))
 
-        # Proxy creation code (Safe v1.3.0 GnosisSafeProxyFactory)
-        # This is the bytecode that deploys a minimal proxy pointing to the singleton
-        proxy_creation_code = bytes.fromhex(
-            "608060405234801561001057600080fd5b506040516101e63803806101e68339818101604052602081101561003357600080fd5b8101908080519060200190929190505050600073ffffffffffffffffffffffffffffffffffffffff168173ffffffffffffffffffffffffffffffffffffffff1614156100ca576040517f08c379a00000000000000000000000000000000000000000000000000000000081526004018080602001828103825260228152602001806101c46022913960400191505060405180910390fd5b806000806101000a81548173ffffffffffffffffffffffffffffffffffffffff021916908373ffffffffffffffffffffffffffffffffffffffff1602179055505060ab806101196000396000f3fe608060405273ffffffffffffffffffffffffffffffffffffffff600054167fa619486e0000000000000000000000000000000000000000000000000000000060003514156050578060005260206000f35b3660008037600080366000845af43d6000803e60008114156070573d6000fd5b3d6000f3fea2646970667358221220d1429297349653a4918076d650332de1a1068c5f3e07c5c82360c277770b955264736f6c63430007060033496e76616c69642073696e676c65746f6e20616464726573732070726f7669646564"
-        )
-
         # deploymentData = creationCode + abi.encode(singleton)
         # Note: We do NOT include the initializer here - that's only for the salt
         # Use the chain-specific singleton address from ChainConfig
         if self.chain_config is None:
             raise ValueError("Chain config not initialized")
-        singleton_address = self.chain_config.safe_singleton_address
-        init_code = proxy_creation_code + encode(["address"], [singleton_address])
-        init_code_hash = keccak(init_code)
+        init_code_hash = _get_proxy_init_code_hash(
+            self.chain_config.safe_singleton_address
+        )
 
         # CREATE2 address calculation: keccak256(0xff ++ factory ++ salt ++ init_code_hash)[12:]
-        factory_address = bytes.fromhex(SAFE_PROXY_FACTORY_ADDRESS[2:])
-        create2_input = b"\xff" + factory_address + salt + init_code_hash
-        address_bytes = keccak(create2_input)[12:]
+        address_bytes = keccak(CREATE2_PREFIX + salt + init_code_hash)[12:]
 
         return to_checksum_address(address_bytes)
 
@@ -208,14 +281,11 @@ class SafeClient:
 
         # 1. Calculate Domain Separator
         # DOMAIN_SEPARATOR_TYPEHASH = keccak256("EIP712Domain(uint256 chainId,address verifyingContract)")
-        domain_separator_typehash = keccak(
-            text="EIP712Domain(uint256 chainId,address verifyingContract)"
-        )
         domain_separator = keccak(
             encode(
                 ["bytes32", "uint256", "address"],
                 [
-                    domain_separator_typehash,
+                    DOMAIN_SEPARATOR_TYPEHASH,
                     self.chain_config.chain_id,
                     to_checksum_address(safe_address),
                 ],
@@ -224,10 +294,6 @@ class SafeClient:
 
         # 2. Calculate SafeTx Hash
         # SAFE_TX_TYPEHASH = keccak256("SafeTx(address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,uint256 baseGas,uint256 gasPrice,address gasToken,address refundReceiver,uint256 nonce)")
-        safe_tx_typehash = keccak(
-            text="SafeTx(address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,uint256 baseGas,uint256 gasPrice,address gasToken,address refundReceiver,uint256 nonce)"
-        )
-
         data_hash = keccak(data)
 
         safe_tx_hash = keccak(
@@ -246,7 +312,7 @@ class SafeClient:
                     "uint256",
                 ],
                 [
-                    safe_tx_typehash,
+                    SAFE_TX_TYPEHASH,
                     to_checksum_address(to),
                     value,
                     data_hash,
@@ -266,23 +332,23 @@ class SafeClient:
 
     async def is_deployed(self, address: str, rpc_url: str) -> bool:
         """Check if a contract is deployed at the given address."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_getCode",
-                    "params": [address, "latest"],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_getCode",
+                "params": [address, "latest"],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                return False
+        if response.status_code != 200:
+            return False
 
-            result = response.json().get("result", "0x")
-            return len(result) > 2
+        result = response.json().get("result", "0x")
+        return len(result) > 2
 
     async def get_safe_info(self, safe_address: str) -> dict[str, Any] | None:
         """Get Safe information from the Transaction Service."""
@@ -290,42 +356,39 @@ class SafeClient:
             raise ValueError("Chain config not initialized")
         url = f"{self.chain_config.safe_tx_service_url}/api/v1/safes/{safe_address}/"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self._get_headers(), timeout=30.0)
+        client = get_http_client()
+        response = await client.get(url, headers=self._get_headers(), timeout=30.0)
 
-            if response.status_code == 404:
-                return None
-            elif response.status_code != 200:
-                logger.error("Safe get info failed: %s", response.text)
-                return None
+        if response.status_code == 404:
+            return None
+        elif response.status_code != 200:
+            logger.error("Safe get info failed: %s", response.text)
+            return None
 
-            return response.json()
+        return response.json()
 
     async def get_nonce(self, safe_address: str, rpc_url: str) -> int:
         """Get the current nonce for a Safe."""
-        # Encode the nonce() call
-        nonce_selector = keccak(text="nonce()")[:4]
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_call",
-                    "params": [
-                        {"to": safe_address, "data": "0x" + nonce_selector.hex()},
-                        "latest",
-                    ],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_call",
+                "params": [
+                    {"to": safe_address, "data": "0x" + NONCE_SELECTOR.hex()},
+                    "latest",
+                ],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                raise IntentKitAPIError(500, "RPCError", "Failed to get Safe nonce")
+        if response.status_code != 200:
+            raise IntentKitAPIError(500, "RPCError", "Failed to get Safe nonce")
 
-            result = response.json().get("result", "0x0")
-            return int(result, 16)
+        result = response.json().get("result", "0x0")
+        return int(result, 16)
 
 
 # =============================================================================
@@ -589,8 +652,7 @@ class SafeWalletProvider(WalletProvider):
 
         logger.info("Using direct owner transfer (Allowance disabled or forced admin)")
         # Encode ERC20 transfer call
-        transfer_selector = keccak(text="transfer(address,uint256)")[:4]
-        transfer_data = transfer_selector + encode(
+        transfer_data = TRANSFER_SELECTOR + encode(
             ["address", "uint256"],
             [to_checksum_address(to), amount],
         )
@@ -695,23 +757,23 @@ class SafeWalletProvider(WalletProvider):
                 500, "ConfigError", f"No RPC URL for chain {target_chain_id}"
             )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_getBalance",
-                    "params": [self.safe_address, "latest"],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_getBalance",
+                "params": [self.safe_address, "latest"],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                raise IntentKitAPIError(500, "RPCError", "Failed to get balance")
+        if response.status_code != 200:
+            raise IntentKitAPIError(500, "RPCError", "Failed to get balance")
 
-            result = response.json().get("result", "0x0")
-            return int(result, 16)
+        result = response.json().get("result", "0x0")
+        return int(result, 16)
 
     async def get_erc20_balance(
         self,
@@ -730,32 +792,31 @@ class SafeWalletProvider(WalletProvider):
             )
 
         # Encode balanceOf call
-        balance_selector = keccak(text="balanceOf(address)")[:4]
-        call_data = balance_selector + encode(["address"], [self.safe_address])
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_call",
-                    "params": [
-                        {
-                            "to": to_checksum_address(token_address),
-                            "data": "0x" + call_data.hex(),
-                        },
-                        "latest",
-                    ],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        call_data = BALANCE_OF_SELECTOR + encode(["address"], [self.safe_address])
+
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_call",
+                "params": [
+                    {
+                        "to": to_checksum_address(token_address),
+                        "data": "0x" + call_data.hex(),
+                    },
+                    "latest",
+                ],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                raise IntentKitAPIError(500, "RPCError", "Failed to get token balance")
+        if response.status_code != 200:
+            raise IntentKitAPIError(500, "RPCError", "Failed to get token balance")
 
-            result = response.json().get("result", "0x0")
-            return int(result, 16)
+        result = response.json().get("result", "0x0")
+        return int(result, 16)
 
     def _get_rpc_url_for_chain(self, chain_id: int) -> str | None:
         """Get RPC URL for a specific chain ID."""
@@ -764,18 +825,12 @@ class SafeWalletProvider(WalletProvider):
         if self.rpc_url and self.chain_config.chain_id == chain_id:
             return self.rpc_url
 
-        for chain_cfg in CHAIN_CONFIGS.values():
-            if chain_cfg.chain_id == chain_id:
-                return chain_cfg.rpc_url
-
-        return None
+        chain_cfg = CHAIN_CONFIGS_BY_ID.get(chain_id)
+        return chain_cfg.rpc_url if chain_cfg else None
 
     def _get_chain_config_for_id(self, chain_id: int) -> ChainConfig | None:
         """Get chain config for a specific chain ID."""
-        for chain_cfg in CHAIN_CONFIGS.values():
-            if chain_cfg.chain_id == chain_id:
-                return chain_cfg
-        return None
+        return CHAIN_CONFIGS_BY_ID.get(chain_id)
 
     def _encode_safe_exec_transaction(
         self,
@@ -798,10 +853,6 @@ class SafeWalletProvider(WalletProvider):
         # execTransaction(address to, uint256 value, bytes data, uint8 operation,
         #                 uint256 safeTxGas, uint256 baseGas, uint256 gasPrice,
         #                 address gasToken, address refundReceiver, bytes signatures)
-        exec_selector = keccak(
-            text="execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)"
-        )[:4]
-
         if signature is not None:
             # Use the provided ECDSA signature
             signatures = signature
@@ -841,7 +892,7 @@ class SafeWalletProvider(WalletProvider):
             ],
         )
 
-        return exec_selector + exec_data
+        return EXEC_TRANSACTION_SELECTOR + exec_data
 
     async def get_allowance_nonce(
         self,
@@ -851,36 +902,35 @@ class SafeWalletProvider(WalletProvider):
     ) -> int:
         """Get the current nonce for an allowance."""
         # getTokenAllowance(address safe, address delegate, address token)
-        selector = keccak(text="getTokenAllowance(address,address,address)")[:4]
-        call_data = selector + encode(
+        call_data = GET_TOKEN_ALLOWANCE_SELECTOR + encode(
             ["address", "address", "address"],
             [self.safe_address, self.privy_wallet_address, token_address],
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_call",
-                    "params": [
-                        {"to": allowance_module, "data": "0x" + call_data.hex()},
-                        "latest",
-                    ],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_call",
+                "params": [
+                    {"to": allowance_module, "data": "0x" + call_data.hex()},
+                    "latest",
+                ],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                raise IntentKitAPIError(500, "RPCError", "Failed to get allowance")
+        if response.status_code != 200:
+            raise IntentKitAPIError(500, "RPCError", "Failed to get allowance")
 
-            result = response.json().get("result", "0x")
-            # Result is uint256[5]: [amount, spent, resetTimeMin, lastResetMin, nonce]
-            if len(result) >= 322:  # 2 + 5 * 64
-                nonce_hex = result[258:322]  # 5th element
-                return int(nonce_hex, 16)
-            return 0
+        result = response.json().get("result", "0x")
+        # Result is uint256[5]: [amount, spent, resetTimeMin, lastResetMin, nonce]
+        if len(result) >= 322:  # 2 + 5 * 64
+            nonce_hex = result[258:322]  # 5th element
+            return int(nonce_hex, 16)
+        return 0
 
     async def generate_transfer_hash(
         self,
@@ -894,10 +944,7 @@ class SafeWalletProvider(WalletProvider):
         """Generate the hash for an allowance transfer."""
         # generateTransferHash(address safe, address token, address to, uint96 amount,
         #                      address paymentToken, uint96 payment, uint16 nonce)
-        selector = keccak(
-            text="generateTransferHash(address,address,address,uint96,address,uint96,uint16)"
-        )[:4]
-        call_data = selector + encode(
+        call_data = GENERATE_TRANSFER_HASH_SELECTOR + encode(
             ["address", "address", "address", "uint96", "address", "uint96", "uint16"],
             [
                 self.safe_address,
@@ -910,26 +957,26 @@ class SafeWalletProvider(WalletProvider):
             ],
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_call",
-                    "params": [
-                        {"to": allowance_module, "data": "0x" + call_data.hex()},
-                        "latest",
-                    ],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_call",
+                "params": [
+                    {"to": allowance_module, "data": "0x" + call_data.hex()},
+                    "latest",
+                ],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                raise IntentKitAPIError(500, "RPCError", "Failed to generate hash")
+        if response.status_code != 200:
+            raise IntentKitAPIError(500, "RPCError", "Failed to generate hash")
 
-            result = response.json().get("result", "0x")
-            return bytes.fromhex(result[2:])
+        result = response.json().get("result", "0x")
+        return bytes.fromhex(result[2:])
 
     def encode_execute_allowance_transfer(
         self,
@@ -941,10 +988,6 @@ class SafeWalletProvider(WalletProvider):
         """Encode executeAllowanceTransfer call."""
         # executeAllowanceTransfer(address safe, address token, address to, uint96 amount,
         #                          address paymentToken, uint96 payment, address delegate, bytes signature)
-        selector = keccak(
-            text="executeAllowanceTransfer(address,address,address,uint96,address,uint96,address,bytes)"
-        )[:4]
-
         sig_bytes = bytes.fromhex(
             signature[2:] if signature.startswith("0x") else signature
         )
@@ -972,7 +1015,7 @@ class SafeWalletProvider(WalletProvider):
             ],
         )
 
-        return selector + exec_data
+        return EXECUTE_ALLOWANCE_TRANSFER_SELECTOR + exec_data
 
 
 # =============================================================================
@@ -1162,8 +1205,7 @@ async def deploy_safe(
     )
 
     # Encode createProxyWithNonce call
-    create_selector = keccak(text="createProxyWithNonce(address,bytes,uint256)")[:4]
-    create_data = create_selector + encode(
+    create_data = CREATE_PROXY_WITH_NONCE_SELECTOR + encode(
         ["address", "bytes", "uint256"],
         [singleton_address, initializer, salt_nonce],
     )
@@ -1240,12 +1282,11 @@ async def deploy_safe(
     # Extract the deployed Safe address from ProxyCreation event
     # Event signature: ProxyCreation(address proxy, address singleton)
     # Topic: keccak256("ProxyCreation(address,address)")
-    proxy_creation_topic = keccak(text="ProxyCreation(address,address)").hex()
     actual_safe_address: str | None = None
 
     for log in receipt.get("logs", []):
         topics = log.get("topics", [])
-        if topics and topics[0].hex() == proxy_creation_topic:
+        if topics and topics[0].hex() == PROXY_CREATION_TOPIC:
             # The proxy address is in the event data (first 32 bytes, padded)
             raw_data = log.get("data", b"")
             if isinstance(raw_data, (bytes, bytearray, memoryview)):
@@ -1281,29 +1322,28 @@ async def is_module_enabled(
 ) -> bool:
     """Check if a module is enabled on a Safe."""
     # isModuleEnabled(address module)
-    selector = keccak(text="isModuleEnabled(address)")[:4]
-    call_data = selector + encode(["address"], [module_address])
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            rpc_url,
-            json={
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [
-                    {"to": safe_address, "data": "0x" + call_data.hex()},
-                    "latest",
-                ],
-                "id": 1,
-            },
-            timeout=30.0,
-        )
+    call_data = IS_MODULE_ENABLED_SELECTOR + encode(["address"], [module_address])
+
+    client = get_http_client()
+    response = await client.post(
+        rpc_url,
+        json={
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [
+                {"to": safe_address, "data": "0x" + call_data.hex()},
+                "latest",
+            ],
+            "id": 1,
+        },
+        timeout=30.0,
+    )
 
-        if response.status_code != 200:
-            return False
+    if response.status_code != 200:
+        return False
 
-        result = response.json().get("result", "0x")
-        return result.endswith("1")
+    result = response.json().get("result", "0x")
+    return result.endswith("1")
 
 
 async def wait_for_safe_deployed(
@@ -1328,31 +1368,30 @@ async def wait_for_safe_deployed(
     Returns:
         True if Safe is deployed and visible, False if max retries exceeded
     """
-    import asyncio
 
     for attempt in range(max_retries):
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "eth_getCode",
-                    "params": [safe_address, "latest"],
-                    "id": 1,
-                },
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "method": "eth_getCode",
+                "params": [safe_address, "latest"],
+                "id": 1,
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code == 200:
-                result = response.json().get("result", "0x")
-                if len(result) > 2:  # Has contract code
-                    if attempt > 0:
-                        logger.info(
-                            "Safe %s visible after %s attempts",
-                            safe_address,
-                            attempt + 1,
-                        )
-                    return True
+        if response.status_code == 200:
+            result = response.json().get("result", "0x")
+            if len(result) > 2:  # Has contract code
+                if attempt > 0:
+                    logger.info(
+                        "Safe %s visible after %s attempts",
+                        safe_address,
+                        attempt + 1,
+                    )
+                return True
 
         if attempt < max_retries - 1:
             logger.debug(
@@ -1393,19 +1432,11 @@ def get_safe_tx_hash(
         The EIP-712 hash to sign
     """
     # Domain separator
-    domain_type_hash = keccak(
-        text="EIP712Domain(uint256 chainId,address verifyingContract)"
-    )
     domain_separator = keccak(
-        domain_type_hash
+        DOMAIN_SEPARATOR_TYPEHASH
         + encode(["uint256", "address"], [chain_id, to_checksum_address(safe_address)])
     )
 
-    # Safe tx type hash
-    safe_tx_type_hash = keccak(
-        text="SafeTx(address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,uint256 baseGas,uint256 gasPrice,address gasToken,address refundReceiver,uint256 nonce)"
-    )
-
     # Encode the transaction data
     data_hash = keccak(data)
     safe_tx_hash_data = encode(
@@ -1423,7 +1454,7 @@ def get_safe_tx_hash(
             "uint256",
         ],
         [
-            safe_tx_type_hash,
+            SAFE_TX_TYPEHASH,
             to_checksum_address(to),
             value,
             data_hash,
@@ -1444,31 +1475,29 @@ def get_safe_tx_hash(
 
 async def get_safe_nonce(safe_address: str, rpc_url: str) -> int:
     """Get the current nonce of a Safe."""
-    selector = keccak(text="nonce()")[:4]
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            rpc_url,
-            json={
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [
-                    {"to": safe_address, "data": "0x" + selector.hex()},
-                    "latest",
-                ],
-                "id": 1,
-            },
-            timeout=30.0,
-        )
+    client = get_http_client()
+    response = await client.post(
+        rpc_url,
+        json={
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [
+                {"to": safe_address, "data": "0x" + NONCE_SELECTOR.hex()},
+                "latest",
+            ],
+            "id": 1,
+        },
+        timeout=30.0,
+    )
 
-        if response.status_code != 200:
-            raise IntentKitAPIError(500, "RPCError", "Failed to get Safe nonce")
+    if response.status_code != 200:
+        raise IntentKitAPIError(500, "RPCError", "Failed to get Safe nonce")
 
-        result = response.json().get("result", "0x0")
-        # Handle empty result '0x' as 0
-        if result == "0x" or not result:
-            return 0
-        return int(result, 16)
+    result = response.json().get("result", "0x0")
+    # Handle empty result '0x' as 0
+    if result == "0x" or not result:
+        return 0
+    return int(result, 16)
 
 
 @overload
@@ -1701,8 +1730,9 @@ async def enable_allowance_module(
     pays for the gas to submit it on-chain.
     """
     # enableModule(address module)
-    enable_selector = keccak(text="enableModule(address)")[:4]
-    enable_data = enable_selector + encode(["address"], [allowance_module_address])
+    enable_data = ENABLE_MODULE_SELECTOR + encode(
+        ["address"], [allowance_module_address]
+    )
 
     # Get Safe nonce from blockchain if not provided
     if nonce is not None:
@@ -1736,11 +1766,7 @@ async def enable_allowance_module(
     signature = r + s + bytes([v])
 
     # Encode execTransaction with the signature
-    exec_selector = keccak(
-        text="execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)"
-    )[:4]
-
-    exec_data = exec_selector + encode(
+    exec_data = EXEC_TRANSACTION_SELECTOR + encode(
         [
             "address",
             "uint256",
@@ -1799,14 +1825,10 @@ async def set_spending_limit(
     pays for the gas to submit it on-chain.
     """
     # First, add delegate: addDelegate(address delegate)
-    add_delegate_selector = keccak(text="addDelegate(address)")[:4]
-    add_delegate_data = add_delegate_selector + encode(["address"], [delegate_address])
+    add_delegate_data = ADD_DELEGATE_SELECTOR + encode(["address"], [delegate_address])
 
     # Then, set allowance: setAllowance(address delegate, address token, uint96 allowanceAmount, uint16 resetTimeMin, uint32 resetBaseMin)
-    set_allowance_selector = keccak(
-        text="setAllowance(address,address,uint96,uint16,uint32)"
-    )[:4]
-    set_allowance_data = set_allowance_selector + encode(
+    set_allowance_data = SET_ALLOWANCE_SELECTOR + encode(
         ["address", "address", "uint96", "uint16", "uint32"],
         [
             delegate_address,
@@ -1833,8 +1855,7 @@ async def set_spending_limit(
     ) + encode_multi_send_tx(allowance_module_address, 0, set_allowance_data)
 
     # multiSend(bytes transactions)
-    multi_send_selector = keccak(text="multiSend(bytes)")[:4]
-    multi_send_data = multi_send_selector + encode(["bytes"], [multi_send_txs])
+    multi_send_data = MULTI_SEND_SELECTOR + encode(["bytes"], [multi_send_txs])
 
     # Get Safe nonce from blockchain if not provided
     if nonce is not None:
@@ -1869,11 +1890,7 @@ async def set_spending_limit(
     signature = r + s + bytes([v])
 
     # Encode execTransaction with signature
-    exec_selector = keccak(
-        text="execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)"
-    )[:4]
-
-    exec_data = exec_selector + encode(
+    exec_data = EXEC_TRANSACTION_SELECTOR + encode(
         [
             "address",
             "uint256",
@@ -2150,11 +2167,7 @@ async def execute_gasless_transaction(
     signature = r + s + bytes([v])
 
     # Encode execTransaction with the signature
-    exec_selector = keccak(
-        text="execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)"
-    )[:4]
-
-    exec_data = exec_selector + encode(
+    exec_data = EXEC_TRANSACTION_SELECTOR + encode(
         [
             "address",
             "uint256",
@@ -2361,8 +2374,7 @@ async def transfer_erc20_gasless(
     logger.info("Using direct owner transfer (gasless)")
     # Fallback to direct owner transfer (gasless)
     # Encode ERC20 transfer call
-    transfer_selector = keccak(text="transfer(address,uint256)")[:4]
-    transfer_data = transfer_selector + encode(
+    transfer_data = TRANSFER_SELECTOR + encode(
         ["address", "uint256"],
         [to_checksum_address(to), amount],
     )
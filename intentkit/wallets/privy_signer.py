@@ -12,6 +12,25 @@ from intentkit.wallets.privy_client import PrivyClient
 logger = logging.getLogger(__name__)
 
 
+# Signing calls all run on one long-lived loop, so the shared Privy HTTP client
+# keeps its connections from one signature to the next
+_signer_loop: asyncio.AbstractEventLoop | None = None
+_signer_loop_lock = threading.Lock()
+
+
+def _get_signer_loop() -> asyncio.AbstractEventLoop:
+    global _signer_loop
+    with _signer_loop_lock:
+        if _signer_loop is None or _signer_loop.is_closed():
+            _signer_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_signer_loop.run_forever,
+                name="privy-signer",
+                daemon=True,
+            ).start()
+        return _signer_loop
+
+
 # =============================================================================
 # Privy Wallet Signer (eth_account compatible)
 # =============================================================================
@@ -27,9 +46,9 @@ class PrivyWalletSigner:
     The signer uses the Privy EOA for signing, which is the actual
     key holder.
 
-    Note: This class uses threading to run async Privy API calls
-    synchronously, avoiding nested event loop issues when called
-    from within an existing async context.
+    Note: This class runs async Privy API calls synchronously on a
+    background event loop thread, avoiding nested event loop issues
+    when called from within an existing async context.
     """
 
     def __init__(
@@ -62,10 +81,10 @@ class PrivyWalletSigner:
 
     def _run_in_thread(self, coro: Any) -> Any:
         """
-        Run an async coroutine in a separate thread.
+        Run an async coroutine on the shared signer event loop.
 
-        This avoids nested event loop errors when called from
-        within an existing async context.
+        The loop runs in a background thread, which avoids nested event
+        loop errors when called from within an existing async context.
 
         Args:
             coro: The coroutine to run.
@@ -76,27 +95,7 @@ class PrivyWalletSigner:
         Raises:
             Any exception raised by the coroutine.
         """
-        result: list[Any] = []
-        error: list[BaseException] = []
-
-        def _target() -> None:
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result.append(loop.run_until_complete(coro))
-                finally:
-                    loop.close()
-            except BaseException as exc:
-                error.append(exc)
-
-        thread = threading.Thread(target=_target, daemon=True)
-        thread.start()
-        thread.join()
-
-        if error:
-            raise error[0]
-        return result[0] if result else None
+        return asyncio.run_coroutine_threadsafe(coro, _get_signer_loop()).result()
 
     def sign_message(self, signable_message: Any) -> Any:
         """
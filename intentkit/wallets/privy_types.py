@@ -17,9 +17,12 @@ SAFE_SINGLETON_L2_CANONICAL = "0x3E5c63644E683549055b9Be8653de26E0B4CD36E"
 SAFE_SINGLETON_L2_EIP155 = "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChainConfig:
-    """Configuration for a blockchain network."""
+    """Configuration for a blockchain network.
+
+    Addresses are stored in checksum form so callers can use them as is.
+    """
 
     chain_id: int
     name: str
@@ -90,6 +93,11 @@ CHAIN_CONFIGS: dict[str, ChainConfig] = {
     ),
 }
 
+# Same configurations indexed by EVM chain ID
+CHAIN_CONFIGS_BY_ID: dict[int, ChainConfig] = {
+    chain_config.chain_id: chain_config for chain_config in CHAIN_CONFIGS.values()
+}
+
 # Safe contract addresses (same across most EVM chains for v1.3.0)
 SAFE_PROXY_FACTORY_ADDRESS = "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"
 SAFE_FALLBACK_HANDLER_ADDRESS = "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"
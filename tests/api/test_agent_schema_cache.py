@@ -0,0 +1,68 @@
+"""Tests for the single-flight agent schema cache."""
+
+import asyncio
+
+import pytest
+
+import app.common.schema as schema_module
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch):
+    monkeypatch.setattr(schema_module, "_agent_schema_task", None)
+    monkeypatch.setattr(schema_module, "_agent_schema_expires_at", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_load(monkeypatch):
+    calls = 0
+
+    async def fake_load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b'{"properties":{}}'
+
+    monkeypatch.setattr(schema_module, "_load_agent_schema", fake_load)
+
+    results = await asyncio.gather(
+        *(schema_module._get_agent_schema() for _ in range(5))
+    )
+
+    assert calls == 1
+    assert all(r == b'{"properties":{}}' for r in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried(monkeypatch):
+    calls = 0
+
+    async def fake_load():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("db down")
+        return b"{}"
+
+    monkeypatch.setattr(schema_module, "_load_agent_schema", fake_load)
+
+    with pytest.raises(RuntimeError):
+        await schema_module._get_agent_schema()
+    assert await schema_module._get_agent_schema() == b"{}"
+    assert calls == 2
+
+
+def test_adapt_agent_schema_removes_hidden_fields():
+    schema = {
+        "properties": {
+            "name": {"type": "string"},
+            "autonomous": {"type": "array"},
+            "telegram_config": {"type": "object"},
+        },
+        "x-groups": [{"id": "basic"}, {"id": "autonomous"}],
+    }
+
+    schema_module._adapt_agent_schema(schema)
+
+    assert schema["properties"] == {"name": {"type": "string"}}
+    assert schema["x-groups"] == [{"id": "basic"}]
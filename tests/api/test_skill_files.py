@@ -0,0 +1,51 @@
+"""Tests for the skill schema/icon startup index."""
+
+import pytest
+
+from intentkit.utils.error import IntentKitAPIError
+
+from app.common.schema import (
+    _scan_skill_files,
+    get_skill_icon,
+    get_skill_schema,
+)
+
+
+def test_scan_skill_files(tmp_path):
+    skill_dir = tmp_path / "demo"
+    skill_dir.mkdir()
+    (skill_dir / "schema.json").write_text("{}")
+    (skill_dir / "demo.png").write_bytes(b"png")
+    (skill_dir / "notes.txt").write_text("ignored")
+    (tmp_path / "base.py").write_text("")
+
+    schemas, icons = _scan_skill_files(tmp_path)
+
+    assert schemas == {"demo": skill_dir / "schema.json"}
+    assert icons == {("demo", "demo", "png"): skill_dir / "demo.png"}
+
+
+def test_scan_skill_files_missing_dir(tmp_path):
+    assert _scan_skill_files(tmp_path / "missing") == ({}, {})
+
+
+@pytest.mark.asyncio
+async def test_get_skill_schema_known_skill():
+    response = await get_skill_schema(skill="twitter")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_skill_schema_unknown_skill():
+    with pytest.raises(IntentKitAPIError) as exc_info:
+        await get_skill_schema(skill="does-not-exist")
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_skill_icon_rejects_traversal():
+    with pytest.raises(IntentKitAPIError) as exc_info:
+        await get_skill_icon(
+            skill="twitter", icon_name="../../../etc/passwd", ext="png"
+        )
+    assert exc_info.value.status_code == 404
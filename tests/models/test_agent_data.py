@@ -0,0 +1,49 @@
+import pytest
+import pytest_asyncio
+
+from intentkit.config.base import Base
+from intentkit.models.agent_data import AgentData, AgentDataTable
+
+
+@pytest_asyncio.fixture()
+async def agent_data_engine(db_engine):
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[AgentDataTable.__table__])
+
+    yield db_engine
+
+
+@pytest.mark.asyncio
+async def test_patch_inserts_missing_row(agent_data_engine):
+    created = await AgentData.patch(
+        "agent-1", {"evm_wallet_address": "0xabc", "twitter_id": "tw-1"}
+    )
+
+    assert created.id == "agent-1"
+    assert created.evm_wallet_address == "0xabc"
+    assert created.twitter_id == "tw-1"
+    assert created.created_at is not None
+    assert created.updated_at is not None
+
+    stored = await AgentData.get("agent-1")
+    assert stored.evm_wallet_address == "0xabc"
+    assert stored.twitter_id == "tw-1"
+
+
+@pytest.mark.asyncio
+async def test_patch_updates_only_given_fields(agent_data_engine):
+    created = await AgentData.patch(
+        "agent-1", {"evm_wallet_address": "0xabc", "twitter_id": "tw-1"}
+    )
+
+    updated = await AgentData.patch("agent-1", {"twitter_id": "tw-2"})
+
+    assert updated.twitter_id == "tw-2"
+    assert updated.evm_wallet_address == "0xabc"
+    assert updated.created_at == created.created_at
+    assert updated.updated_at > created.updated_at
+
+    stored = await AgentData.get("agent-1")
+    assert stored.twitter_id == "tw-2"
+    assert stored.evm_wallet_address == "0xabc"
+    assert stored.updated_at == updated.updated_at
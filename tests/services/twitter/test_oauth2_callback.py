@@ -0,0 +1,88 @@
+import httpx
+import pytest
+
+from app.services.twitter import oauth2_callback
+
+
+@pytest.mark.asyncio
+async def test_get_twitter_me_uses_bearer_token(monkeypatch):
+    seen: dict[str, httpx.Request] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["request"] = request
+        return httpx.Response(
+            200, json={"data": {"id": "1", "username": "agent", "name": "Agent"}}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(oauth2_callback, "_http_client", client)
+
+    me = await oauth2_callback.get_twitter_me("access-token")
+
+    assert me["data"]["username"] == "agent"
+    request = seen["request"]
+    assert request.headers["Authorization"] == "Bearer access-token"
+    assert request.url.params["user.fields"] == "id,username,name,verified"
+
+
+@pytest.mark.asyncio
+async def test_get_twitter_me_raises_on_error(monkeypatch):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(401))
+    )
+    monkeypatch.setattr(oauth2_callback, "_http_client", client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await oauth2_callback.get_twitter_me("expired-token")
+
+
+def test_http_client_is_shared(monkeypatch):
+    monkeypatch.setattr(oauth2_callback, "_http_client", None)
+    assert oauth2_callback._get_http_client() is oauth2_callback._get_http_client()
+
+
+def test_oauth_state_parse():
+    state = oauth2_callback.OAuthState.parse(
+        "agent_id=agent-1&redirect_uri=https%3A%2F%2Fapp.example.com%2Fcb%3Fa%3D1"
+    )
+
+    assert state.agent_id == "agent-1"
+    assert state.redirect_uri == "https://app.example.com/cb?a=1"
+
+
+def test_oauth_state_parse_missing_and_repeated_fields():
+    state = oauth2_callback.OAuthState.parse("agent_id=first&agent_id=second&x=1")
+
+    assert state.agent_id == "first"
+    assert state.redirect_uri == ""
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://app.example.com", True),
+        ("https://app.example.com/agents/1?tab=x", True),
+        ("https://app.example.com?a=1", True),
+        ("https://APP.example.com/cb", False),
+        ("https://app.example.com.evil.com/cb", False),
+        ("https://app.example.com@evil.com/cb", False),
+        ("http://app.example.com/cb", False),
+        ("https://evil.com/?next=https://app.example.com/", False),
+        ("/relative/path", False),
+        ("", False),
+    ],
+)
+def test_is_valid_redirect_url(monkeypatch, url, expected):
+    monkeypatch.setattr(
+        oauth2_callback.config, "app_base_url", "https://app.example.com/base"
+    )
+
+    assert oauth2_callback.is_valid_redirect_url(url) is expected
+
+
+def test_is_valid_redirect_url_follows_config_change(monkeypatch):
+    monkeypatch.setattr(oauth2_callback.config, "app_base_url", "https://a.example.com")
+    assert oauth2_callback.is_valid_redirect_url("https://a.example.com/cb")
+
+    monkeypatch.setattr(oauth2_callback.config, "app_base_url", "https://b.example.com")
+    assert not oauth2_callback.is_valid_redirect_url("https://a.example.com/cb")
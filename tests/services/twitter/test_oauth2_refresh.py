@@ -8,13 +8,40 @@ import pytest
 
 from app.services.twitter import oauth2_refresh
 
+# The autouse fixture below replaces it on the module
+save_refreshed_tokens = oauth2_refresh.save_refreshed_tokens
+
 
 @pytest.fixture(autouse=True)
-def patch_agent_data_save(monkeypatch):
-    async def fake_save(self):  # noqa: ANN001
-        return None
+def saved_updates(monkeypatch):
+    saved: dict[str, dict[str, Any]] = {}
+
+    async def fake_save(updates: dict[str, dict[str, Any]]):
+        saved.update(updates)
+
+    monkeypatch.setattr(oauth2_refresh, "save_refreshed_tokens", fake_save)
+    return saved
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store: dict[str, str] = {}
 
-    monkeypatch.setattr(oauth2_refresh.AgentData, "save", fake_save)
+    async def set(self, key, value, nx=False, ex=None):  # noqa: ANN001
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):  # noqa: ANN001
+        self.store.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(oauth2_refresh, "get_redis", lambda: redis)
+    return redis
 
 
 def _build_agent(identifier: str) -> Any:
@@ -46,13 +73,15 @@ async def test_refresh_token_runs_in_background_thread(monkeypatch):
 
     monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", blocking_refresh)
 
-    await oauth2_refresh.refresh_token(agent)
+    update_data = await oauth2_refresh.refresh_token(agent)
 
     assert refresh_thread["id"] != main_thread
+    assert update_data is not None
+    assert update_data["twitter_access_token"] == "new-access"
 
 
 @pytest.mark.asyncio
-async def test_refresh_expiring_tokens_runs_concurrently(monkeypatch):
+async def test_refresh_expiring_tokens_runs_concurrently(monkeypatch, saved_updates):
     agents = [_build_agent("agent-1"), _build_agent("agent-2")]
     call_count = 0
 
@@ -66,7 +95,7 @@ async def test_refresh_expiring_tokens_runs_concurrently(monkeypatch):
             "expires_at": int(time.time()) + 60,
         }
 
-    async def fake_get_expiring_tokens():
+    async def fake_get_expiring_tokens(now=None):  # noqa: ANN001
         return agents
 
     monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", blocking_refresh)
@@ -78,6 +107,37 @@ async def test_refresh_expiring_tokens_runs_concurrently(monkeypatch):
 
     assert call_count == len(agents)
     assert duration < 0.19
+    assert set(saved_updates) == {"agent-1", "agent-2"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_expiring_tokens_bounds_concurrency(monkeypatch, saved_updates):
+    agents = [_build_agent(f"agent-{i}") for i in range(6)]
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def blocking_refresh(refresh_token: str):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return {"access_token": "a", "refresh_token": "r"}
+
+    async def fake_get_expiring_tokens(now=None):  # noqa: ANN001
+        return agents
+
+    monkeypatch.setattr(oauth2_refresh, "REFRESH_CONCURRENCY", 2)
+    monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", blocking_refresh)
+    monkeypatch.setattr(oauth2_refresh, "get_expiring_tokens", fake_get_expiring_tokens)
+
+    await oauth2_refresh.refresh_expiring_tokens()
+
+    assert max_in_flight <= 2
+    assert len(saved_updates) == len(agents)
 
 
 @pytest.mark.asyncio
@@ -91,6 +151,118 @@ async def test_refresh_token_logs_errors(monkeypatch):
     monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", failing_refresh)
     monkeypatch.setattr(oauth2_refresh.logger, "error", error_logger)
 
-    await oauth2_refresh.refresh_token(agent)
+    assert await oauth2_refresh.refresh_token(agent) is None
 
     error_logger.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_skips_when_locked(monkeypatch, fake_redis):
+    agent = _build_agent("agent-4")
+    refresh = Mock()
+    monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", refresh)
+    fake_redis.store["intentkit:twitter:refresh_lock:agent-4"] = "1"
+
+    assert await oauth2_refresh.refresh_token(agent) is None
+
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_releases_lock_on_failure(monkeypatch, fake_redis):
+    agent = _build_agent("agent-5")
+
+    def failing_refresh(refresh_token: str):  # noqa: ANN001
+        raise RuntimeError("refresh failed")
+
+    monkeypatch.setattr(oauth2_refresh.oauth2_user_handler, "refresh", failing_refresh)
+
+    assert await oauth2_refresh.refresh_token(agent) is None
+    assert "intentkit:twitter:refresh_lock:agent-5" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_refresh_expiring_tokens_saves_in_batches(monkeypatch):
+    agents = [_build_agent(f"agent-{i}") for i in range(5)]
+    batches: list[set[str]] = []
+
+    async def fake_save(updates: dict[str, dict[str, Any]]):
+        batches.append(set(updates))
+
+    async def fake_get_expiring_tokens(now=None):  # noqa: ANN001
+        return agents
+
+    monkeypatch.setattr(oauth2_refresh, "REFRESH_SAVE_BATCH_SIZE", 2)
+    monkeypatch.setattr(oauth2_refresh, "save_refreshed_tokens", fake_save)
+    monkeypatch.setattr(
+        oauth2_refresh.oauth2_user_handler,
+        "refresh",
+        lambda refresh_token: {"access_token": "a", "refresh_token": "r"},
+    )
+    monkeypatch.setattr(oauth2_refresh, "get_expiring_tokens", fake_get_expiring_tokens)
+
+    await oauth2_refresh.refresh_expiring_tokens()
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert set().union(*batches) == {agent.id for agent in agents}
+
+
+class FakeSession:
+    def __init__(self, saved: dict[str, dict[str, Any]]):
+        self.saved = saved
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):  # noqa: ANN002
+        return False
+
+    async def execute(self, statement, params=None):  # noqa: ANN001
+        if params is not None:
+            raise RuntimeError("bulk update failed")
+        compiled = statement.compile().params
+        agent_id = compiled["id_1"]
+        if agent_id == "agent-bad":
+            raise RuntimeError("bad row")
+        self.saved[agent_id] = {
+            key: compiled[key]
+            for key in ("twitter_access_token", "twitter_refresh_token")
+        }
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_save_refreshed_tokens_falls_back_to_single_rows(monkeypatch):
+    saved: dict[str, dict[str, Any]] = {}
+    monkeypatch.setattr(oauth2_refresh, "get_session", lambda: FakeSession(saved))
+    updates = {
+        "agent-1": {"twitter_access_token": "a1", "twitter_refresh_token": "r1"},
+        "agent-bad": {"twitter_access_token": "a2", "twitter_refresh_token": "r2"},
+        "agent-3": {"twitter_access_token": "a3", "twitter_refresh_token": "r3"},
+    }
+
+    await save_refreshed_tokens(updates)
+
+    assert saved == {
+        "agent-1": updates["agent-1"],
+        "agent-3": updates["agent-3"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_refresh_expiring_tokens_passes_one_clock_reading(monkeypatch):
+    seen: list[Any] = []
+
+    async def fake_get_expiring_tokens(now=None):  # noqa: ANN001
+        seen.append(now)
+        return []
+
+    monkeypatch.setattr(oauth2_refresh, "get_expiring_tokens", fake_get_expiring_tokens)
+
+    await oauth2_refresh.refresh_expiring_tokens()
+
+    assert len(seen) == 1
+    assert seen[0] is not None
+    assert seen[0].tzinfo is not None
@@ -0,0 +1,122 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from intentkit.wallets import cdp
+
+
+@pytest.fixture(autouse=True)
+def clear_cdp_caches():
+    cdp._wallet_providers.clear()
+    cdp._wallet_provider_locks.clear()
+    cdp._evm_accounts.clear()
+    yield
+    cdp._wallet_providers.clear()
+    cdp._wallet_provider_locks.clear()
+    cdp._evm_accounts.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_wallet_provider_builds_provider_once():
+    agent = SimpleNamespace(
+        id="agent-1", wallet_provider="cdp", network_id="base-mainnet", slug="a"
+    )
+    created: list[str] = []
+
+    async def fake_ensure(agent, agent_data=None):
+        await asyncio.sleep(0)
+        created.append(agent.id)
+        return SimpleNamespace(address="0xabc"), agent_data
+
+    async def fake_get(agent_id):
+        return SimpleNamespace(evm_wallet_address=None)
+
+    with (
+        patch.object(cdp.AgentData, "get", side_effect=fake_get),
+        patch.object(cdp, "_ensure_evm_account", side_effect=fake_ensure),
+        patch.object(cdp, "get_cdp_client", return_value=MagicMock()),
+        patch.object(cdp, "get_async_web3_client", return_value=MagicMock()),
+    ):
+        providers = await asyncio.gather(
+            *(cdp.get_wallet_provider(agent) for _ in range(5))
+        )
+        cached = await cdp.get_wallet_provider(agent)
+
+    assert created == ["agent-1"]
+    assert all(p is providers[0] for p in providers)
+    assert cached is providers[0]
+
+
+@pytest.mark.asyncio
+async def test_get_wallet_provider_rebuilds_after_invalidation():
+    agent = SimpleNamespace(
+        id="agent-1", wallet_provider="cdp", network_id="base-mainnet", slug="a"
+    )
+    agent_data = SimpleNamespace(evm_wallet_address="0xabc")
+    agent_data_get = AsyncMock(return_value=agent_data)
+
+    async def fake_ensure(agent, agent_data=None):
+        return SimpleNamespace(address=agent_data.evm_wallet_address), agent_data
+
+    with (
+        patch.object(cdp.AgentData, "get", agent_data_get),
+        patch.object(cdp, "_ensure_evm_account", side_effect=fake_ensure),
+        patch.object(cdp, "get_cdp_client", return_value=MagicMock()),
+        patch.object(cdp, "get_async_web3_client", return_value=MagicMock()),
+    ):
+        first = await cdp.get_wallet_provider(agent)
+        assert await cdp.get_wallet_provider(agent) is first
+        # Cache hits do not read agent data
+        agent_data_get.assert_awaited_once()
+
+        agent_data.evm_wallet_address = "0xdef"
+        cdp.invalidate_wallet_provider("agent-1")
+        second = await cdp.get_wallet_provider(agent)
+
+    assert second is not first
+    assert second.get_address() == "0xdef"
+    assert cdp._wallet_providers["agent-1"].address == "0xdef"
+
+
+def test_provider_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(cdp, "WALLET_PROVIDER_CACHE_SIZE", 2)
+    providers = [MagicMock() for _ in range(3)]
+
+    cdp._cache_provider("a", "base-mainnet", "0xa", providers[0])
+    cdp._cache_provider("b", "base-mainnet", "0xb", providers[1])
+    assert cdp._get_cached_provider("a") is not None
+    cdp._cache_provider("c", "base-mainnet", "0xc", providers[2])
+
+    assert list(cdp._wallet_providers) == ["a", "c"]
+
+
+def test_provider_cache_expires_entries(monkeypatch):
+    monkeypatch.setattr(cdp, "WALLET_PROVIDER_CACHE_TTL", -1)
+
+    cdp._cache_provider("a", "base-mainnet", "0xa", MagicMock())
+
+    assert cdp._get_cached_provider("a") is None
+    assert "a" not in cdp._wallet_providers
+
+
+@pytest.mark.asyncio
+async def test_ensure_evm_account_reuses_fetched_account():
+    agent = SimpleNamespace(id="agent-1", slug="a")
+    account = SimpleNamespace(address="0xabc")
+    cdp_client = MagicMock()
+    cdp_client.evm.get_account = AsyncMock(return_value=account)
+
+    async def fake_get(agent_id):
+        return SimpleNamespace(evm_wallet_address="0xabc")
+
+    with (
+        patch.object(cdp.AgentData, "get", side_effect=fake_get),
+        patch.object(cdp, "get_cdp_client", return_value=cdp_client),
+    ):
+        first, _ = await cdp._ensure_evm_account(agent)
+        second, _ = await cdp._ensure_evm_account(agent)
+
+    assert first is second is account
+    cdp_client.evm.get_account.assert_awaited_once_with(address="0xabc")
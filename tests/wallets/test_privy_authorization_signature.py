@@ -41,12 +41,9 @@ async def test_rpc_includes_privy_authorization_signature_header() -> None:
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        mock_cm = MagicMock()
-        mock_cm.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cm.__aexit__ = AsyncMock(return_value=None)
-
         with patch(
-            "intentkit.wallets.privy_client.httpx.AsyncClient", return_value=mock_cm
+            "intentkit.wallets.privy_client.get_http_client",
+            return_value=mock_client,
         ):
             await privy.sign_hash("wallet_1", b"\x11" * 32)
 
@@ -1,15 +1,21 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import get_overloads, get_type_hints
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from web3.types import TxReceipt
 
-from intentkit.wallets import privy
+from intentkit.utils.error import IntentKitAPIError
+from intentkit.wallets import privy, privy_client, privy_signer
 from intentkit.wallets.privy import PrivyClient
+from intentkit.wallets.privy_signer import PrivyWalletSigner
 
 
-def _mock_async_client(
-    mock_async_client_cls: MagicMock, response_json: dict[str, object]
+def _mock_http_client(
+    mock_get_http_client: MagicMock, response_json: dict[str, object]
 ) -> MagicMock:
     mock_response = MagicMock()
     mock_response.status_code = 201
@@ -17,11 +23,7 @@ def _mock_async_client(
 
     mock_client = MagicMock()
     mock_client.post = AsyncMock(return_value=mock_response)
-
-    mock_cm = MagicMock()
-    mock_cm.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_cm.__aexit__ = AsyncMock(return_value=None)
-    mock_async_client_cls.return_value = mock_cm
+    mock_get_http_client.return_value = mock_client
     return mock_client
 
 
@@ -29,10 +31,10 @@ class TestPrivyClient:
     @pytest.mark.asyncio
     async def test_create_key_quorum(self) -> None:
         with patch(
-            "intentkit.wallets.privy_client.httpx.AsyncClient"
-        ) as mock_async_client_cls:
-            mock_client = _mock_async_client(
-                mock_async_client_cls,
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(
+                mock_get_http_client,
                 response_json={"id": "kq_test"},
             )
 
@@ -59,10 +61,10 @@ class TestPrivyClient:
     @pytest.mark.asyncio
     async def test_create_wallet_with_additional_signers(self) -> None:
         with patch(
-            "intentkit.wallets.privy_client.httpx.AsyncClient"
-        ) as mock_async_client_cls:
-            mock_client = _mock_async_client(
-                mock_async_client_cls,
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(
+                mock_get_http_client,
                 response_json={
                     "id": "wallet_1",
                     "address": "0x0000000000000000000000000000000000000001",
@@ -88,10 +90,10 @@ class TestPrivyClient:
     @pytest.mark.asyncio
     async def test_create_wallet_with_owner_key_quorum(self) -> None:
         with patch(
-            "intentkit.wallets.privy_client.httpx.AsyncClient"
-        ) as mock_async_client_cls:
-            mock_client = _mock_async_client(
-                mock_async_client_cls,
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(
+                mock_get_http_client,
                 response_json={
                     "id": "wallet_2",
                     "address": "0x0000000000000000000000000000000000000002",
@@ -114,6 +116,71 @@ class TestPrivyClient:
                 "owner_id": "kq_owner",
             }
 
+    @pytest.mark.asyncio
+    async def test_send_transaction_returns_hash(self) -> None:
+        with patch(
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(
+                mock_get_http_client,
+                response_json={"data": {"hash": "0xhash"}},
+            )
+
+            privy = PrivyClient()
+            privy.app_id = "app"
+            privy.app_secret = "secret"
+            privy.base_url = "https://api.privy.io/v1"
+
+            tx_hash = await privy.send_transaction(
+                "wallet_1", chain_id=8453, to="0xto", value=1
+            )
+
+            assert tx_hash == "0xhash"
+            args, kwargs = mock_client.post.call_args
+            assert args[0] == "https://api.privy.io/v1/wallets/wallet_1/rpc"
+            assert kwargs["json"]["caip2"] == "eip155:8453"
+            assert kwargs["timeout"] == 60.0
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_includes_response_text(self) -> None:
+        with patch(
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(mock_get_http_client, response_json={})
+            mock_client.post.return_value.status_code = 400
+            mock_client.post.return_value.text = "insufficient funds"
+
+            privy = PrivyClient()
+            privy.app_id = "app"
+            privy.app_secret = "secret"
+
+            with pytest.raises(IntentKitAPIError) as exc_info:
+                await privy.send_transaction("wallet_1", chain_id=8453, to="0xto")
+
+            assert "insufficient funds" in str(exc_info.value.message)
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_message_is_not_a_template(self) -> None:
+        with patch(
+            "intentkit.wallets.privy_client.get_http_client"
+        ) as mock_get_http_client:
+            mock_client = _mock_http_client(mock_get_http_client, response_json={})
+            mock_client.post.return_value.status_code = 400
+            mock_client.post.return_value.text = '{"error": "bad"}'
+
+            privy = PrivyClient()
+            privy.app_id = "app"
+            privy.app_secret = "secret"
+
+            with pytest.raises(IntentKitAPIError) as exc_info:
+                await privy._rpc(
+                    "wallet_1",
+                    {"method": "personal_sign"},
+                    error_message="Failed {literally}",
+                )
+
+            assert exc_info.value.message == "Failed {literally}"
+
     def test_get_authorization_public_keys_empty(self) -> None:
         privy_client = PrivyClient()
         privy_client._authorization_key_objects = []
@@ -144,3 +211,69 @@ def testsend_transaction_with_master_wallet_overloads() -> None:
     returns = {get_type_hints(overload)["return"] for overload in overloads}
     assert str in returns
     assert tuple[str, TxReceipt] in returns
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared() -> None:
+    assert privy_client.get_http_client() is privy_client.get_http_client()
+
+
+@pytest.mark.asyncio
+async def test_close_http_client_closes_signer_loop_client() -> None:
+    async def _get_client():
+        return privy_client.get_http_client()
+
+    signer_client = asyncio.run_coroutine_threadsafe(
+        _get_client(), privy_signer._get_signer_loop()
+    ).result()
+    app_client = privy_client.get_http_client()
+
+    await privy_client.close_http_client()
+
+    assert app_client.is_closed
+    assert signer_client.is_closed
+    assert privy_client._http_clients == {}
+
+
+class _SignatureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"data": {"signature": "0x" + "11" * 64 + "1b"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def test_signer_signs_repeatedly_on_one_event_loop() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SignatureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = PrivyClient()
+        client.app_id = "app"
+        client.app_secret = "secret"
+        client.base_url = f"http://127.0.0.1:{server.server_port}"
+        client.authorization_private_keys = []
+        client._authorization_key_objects = []
+        signer = PrivyWalletSigner(
+            client, "wallet_1", "0x000000000000000000000000000000000000dEaD"
+        )
+
+        # Both calls run on the shared signer loop and reuse its HTTP client
+        first = signer.sign_message("hello")
+        clients = dict(privy_client._http_clients)
+        second = signer.sign_message("hello")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first.signature == second.signature
+    assert privy_client._http_clients == clients
+    assert not any(client.is_closed for client in clients.values())
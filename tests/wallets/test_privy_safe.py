@@ -0,0 +1,57 @@
+import pytest
+
+from intentkit.wallets import privy_safe
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("TRANSFER_SELECTOR", "a9059cbb"),
+        ("BALANCE_OF_SELECTOR", "70a08231"),
+        ("NONCE_SELECTOR", "affed0e0"),
+        ("EXEC_TRANSACTION_SELECTOR", "6a761202"),
+        ("ENABLE_MODULE_SELECTOR", "610b5925"),
+        ("MULTI_SEND_SELECTOR", "8d80ff0a"),
+        ("CREATE_PROXY_WITH_NONCE_SELECTOR", "1688f0b9"),
+    ],
+)
+def test_selectors_match_known_values(name: str, expected: str) -> None:
+    assert getattr(privy_safe, name).hex() == expected
+
+
+@pytest.mark.parametrize(
+    ("network_id", "expected"),
+    [
+        ("base-mainnet", "0xF3E218A42871375edBDdEce2F717d1e36293B951"),
+        ("bnb-mainnet", "0xA0Ec37CA319143F19eEad7A2ee9Da3Ed070e99D1"),
+    ],
+)
+def test_predict_safe_address_is_stable(network_id: str, expected: str) -> None:
+    client = privy_safe.SafeClient(network_id)
+
+    predicted = client.predict_safe_address(
+        "0x742d35Cc6634C0532925a3b844Bc9e7595f8fE21", salt_nonce=42
+    )
+
+    assert predicted == expected
+
+
+def test_predict_safe_address_reuses_prediction(monkeypatch) -> None:
+    monkeypatch.setattr(privy_safe, "_predicted_safe_addresses", {})
+    client = privy_safe.SafeClient("base-mainnet")
+    calls = 0
+    original = client._calculate_create2_address
+
+    def counting_create2(initializer: bytes, salt_nonce: int) -> str:
+        nonlocal calls
+        calls += 1
+        return original(initializer, salt_nonce)
+
+    monkeypatch.setattr(client, "_calculate_create2_address", counting_create2)
+    owner = "0x742d35cc6634c0532925a3b844bc9e7595f8fe21"
+
+    first = client.predict_safe_address(owner, salt_nonce=42)
+    second = client.predict_safe_address(owner.upper().replace("0X", "0x"), 42)
+
+    assert first == second == "0xF3E218A42871375edBDdEce2F717d1e36293B951"
+    assert calls == 1